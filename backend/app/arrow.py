@@ -0,0 +1,72 @@
+# app/arrow.py
+#
+# Apache Arrow IPC stream encoding of the in-memory datasets, served to clients that send
+# Accept: application/vnd.apache.arrow.stream. Numeric columns reuse the frame's NumPy buffers
+# (only a validity bitmap is built where a float column has NaNs) and Country is sent as a
+# dictionary array over the categorical codes, so no value is converted row by row.
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional; without it Arrow requests get 406 Not Acceptable
+    pa = None
+
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+
+def arrow_available() -> bool:
+    return pa is not None
+
+
+# q-value of a media type in an Accept header (0 when absent); "*/*" and "type/*" count only for JSON
+def _quality(accept: str, media_type: str) -> float:
+    best = 0.0
+    for part in accept.split(","):
+        fields = [field.strip() for field in part.split(";")]
+        candidate = fields[0].lower()
+        if candidate != media_type and not (media_type == "application/json" and candidate in ("*/*", "application/*")):
+            continue
+        quality = 1.0
+        for param in fields[1:]:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        best = max(best, quality)
+    return best
+
+
+# True when the client prefers an Arrow stream over JSON
+def wants_arrow(accept: Optional[str]) -> bool:
+    if not accept:
+        return False
+    arrow = _quality(accept, ARROW_STREAM)
+    return arrow > 0 and arrow >= _quality(accept, "application/json")
+
+
+def _column(series: pd.Series) -> "pa.Array":
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        dictionary = pa.array(series.cat.categories.tolist(), type=pa.string())
+        return pa.DictionaryArray.from_arrays(pa.array(codes), dictionary)
+    values = series.to_numpy()
+    if values.dtype.kind == "f":
+        missing = np.isnan(values)
+        if missing.any():
+            validity = pa.py_buffer(np.packbits(~missing, bitorder="little"))
+            return pa.Array.from_buffers(pa.from_numpy_dtype(values.dtype), len(values), [validity, pa.py_buffer(values)], null_count=int(missing.sum()))
+    return pa.array(values)
+
+
+# One record batch per frame, written as an IPC stream
+def to_arrow_stream(frame: pd.DataFrame) -> bytes:
+    frame = frame.reset_index(drop=True)
+    batch = pa.RecordBatch.from_arrays([_column(frame[column]) for column in frame.columns], names=list(frame.columns))
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
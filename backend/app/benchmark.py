@@ -0,0 +1,267 @@
+# app/benchmark.py
+#
+# python -m app.benchmark: drive every API route in-process through the test client and report latency
+# percentiles, throughput, response size and allocated memory per endpoint. Results can be saved as a
+# JSON baseline and compared against a previous one; the run fails when an endpoint got slower (or
+# allocates more) than the threshold allows.
+#
+# Routes are discovered from the OpenAPI schema, so a new route is benchmarked as soon as it exists;
+# a route with a required parameter that has no sample below stops the run until one is added.
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Sample values for required path and query parameters, by parameter name
+SAMPLE_PARAMS: Dict[str, Any] = {
+    "country": "India",
+    "year": 2016,
+    "factor": "gdp",
+    "datasets": "medals,population,political_stability",
+}
+# Routes not benchmarked: admin actions change the server state
+SKIP_PREFIXES = ("/api/admin",)
+
+
+def _feature_rows(year: int) -> List[dict]:
+    from app.features import build_feature_matrix
+    from app.store import get_store
+
+    frame = build_feature_matrix(get_store(), year).fillna(0)
+    return [
+        {"country": row.country, "population": float(row.population), "psi": float(row.psi), "medals": int(row.medals)}
+        for row in frame.itertuples(index=False)
+    ]
+
+
+# Request bodies for POST routes, by path; built once the data is loaded
+BODIES: Dict[str, Callable[[], Any]] = {
+    "/api/batch": lambda: {
+        "medals": {"dataset": "medals", "fields": ["Gold", "Silver", "Bronze"], "year_from": 2016},
+        "population": {"dataset": "population", "countries": ["India", "China"]},
+    },
+    "/api/clusteranalysis/cluster": lambda: _feature_rows(2016),
+    "/api/dimensionality-reduction/pca": lambda: _feature_rows(2016),
+}
+
+
+@dataclass
+class Case:
+    name: str
+    method: str
+    path: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Any = None
+    # Called before every request (e.g. to empty a cache)
+    setup: Optional[Callable[[], None]] = None
+
+
+def _clear_results_cache():
+    from app.results_cache import results_cache
+
+    results_cache.clear()
+
+
+# Variants worth tracking on their own: filters, other formats and encodings, uncached model fits
+def extra_cases() -> List[Case]:
+    return [
+        Case("GET /api/panel?fields&year_from", "GET", "/api/panel", params={"fields": "gdp,population", "year_from": 2016}),
+        Case("GET /api/population?countries", "GET", "/api/population", params={"countries": "India,China,Brazil"}),
+        Case("GET /api/panel?format=columns", "GET", "/api/panel", params={"format": "columns"}),
+        Case("GET /api/panel [arrow]", "GET", "/api/panel", headers={"Accept": "application/vnd.apache.arrow.stream"}),
+        Case("GET /api/panel [br]", "GET", "/api/panel", headers={"Accept-Encoding": "br"}),
+        Case("GET /api/panel [gzip]", "GET", "/api/panel", headers={"Accept-Encoding": "gzip"}),
+        Case("GET /api/medals/rankings/{year}?by=gold", "GET", "/api/medals/rankings/2016", params={"by": "gold"}),
+        Case("GET /api/clusteranalysis/cluster [uncached]", "GET", "/api/clusteranalysis/cluster",
+             params={"year": 2016}, setup=_clear_results_cache),
+        Case("GET /api/dimensionality-reduction/pca [uncached]", "GET", "/api/dimensionality-reduction/pca",
+             params={"year": 2016}, setup=_clear_results_cache),
+    ]
+
+
+# One case per operation of the OpenAPI schema, with sample values filled in
+def route_cases(app) -> List[Case]:
+    cases = []
+    missing = []
+    for path, operations in app.openapi()["paths"].items():
+        if path.startswith(SKIP_PREFIXES):
+            continue
+        for method, operation in operations.items():
+            name = f"{method.upper()} {path}"
+            url = path
+            params = {}
+            for parameter in operation.get("parameters", []):
+                if not parameter.get("required"):
+                    continue
+                if parameter["name"] not in SAMPLE_PARAMS:
+                    missing.append(f"{name}: {parameter['name']}")
+                    continue
+                value = SAMPLE_PARAMS[parameter["name"]]
+                if parameter["in"] == "path":
+                    url = url.replace("{" + parameter["name"] + "}", str(value))
+                else:
+                    params[parameter["name"]] = value
+            body = None
+            if "requestBody" in operation:
+                if path not in BODIES:
+                    missing.append(f"{name}: request body")
+                    continue
+                body = BODIES[path]()
+            cases.append(Case(name, method.upper(), url, params=params, body=body))
+    if missing:
+        raise SystemExit(f"❌ No sample for {missing}; add one to SAMPLE_PARAMS / BODIES in app/benchmark.py")
+    return cases
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    index = (len(sorted_values) - 1) * q
+    low, high = math.floor(index), math.ceil(index)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (index - low)
+
+
+def _send(client, case: Case):
+    if case.setup is not None:
+        case.setup()
+    return client.request(case.method, case.path, params=case.params, headers=case.headers, json=case.body)
+
+
+# Latency over up to `requests` calls (stopping after max_seconds), then allocations over a few more
+# with tracemalloc on, since tracing slows every allocation down. Allocations include the test client's
+# own (building the request, decoding the body).
+def run_case(client, case: Case, requests: int, warmup: int, max_seconds: float, memory_requests: int) -> dict:
+    for _ in range(max(warmup, 1)):
+        response = _send(client, case)
+    if response.status_code >= 400:
+        return {"endpoint": case.name, "error": f"HTTP {response.status_code}: {response.text[:200]}"}
+
+    latencies = []
+    started = time.perf_counter()
+    while len(latencies) < requests and (len(latencies) < 5 or time.perf_counter() - started < max_seconds):
+        request_started = time.perf_counter()
+        _send(client, case)
+        latencies.append(time.perf_counter() - request_started)
+    elapsed = time.perf_counter() - started
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(memory_requests):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            _send(client, case)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    ms = [latency * 1000 for latency in latencies]
+    return {
+        "endpoint": case.name,
+        "requests": len(ms),
+        "mean_ms": round(statistics.fmean(ms), 4),
+        "p50_ms": round(_percentile(ms, 0.50), 4),
+        "p90_ms": round(_percentile(ms, 0.90), 4),
+        "p95_ms": round(_percentile(ms, 0.95), 4),
+        "p99_ms": round(_percentile(ms, 0.99), 4),
+        "max_ms": round(ms[-1], 4),
+        "throughput_rps": round(len(ms) / elapsed, 1),
+        # As sent, before the client decodes a compressed body
+        "response_bytes": int(response.headers.get("content-length", len(response.content))),
+        "peak_alloc_kb": round(max(peaks) / 1024, 1) if peaks else None,
+    }
+
+
+def run_benchmarks(match: Optional[str] = None, requests: int = 200, warmup: int = 3, max_seconds: float = 2.0, memory_requests: int = 3) -> dict:
+    # Build every table before serving, so no measured request pays for a warm-up
+    os.environ.setdefault("OLYMPIQ_WARMUP", "startup")
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    results = []
+    with TestClient(app) as client:
+        cases = route_cases(app) + extra_cases()
+        if match:
+            cases = [case for case in cases if match in case.name]
+        for case in cases:
+            result = run_case(client, case, requests, warmup, max_seconds, memory_requests)
+            _print_result(result)
+            results.append(result)
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {"requests": requests, "warmup": warmup, "max_seconds": max_seconds},
+        "results": results,
+    }
+
+
+def _print_result(result: dict):
+    if "error" in result:
+        print(f"❌ {result['endpoint']}: {result['error']}")
+        return
+    print(
+        f"{result['endpoint']:<58} p50 {result['p50_ms']:>8.2f} ms  p95 {result['p95_ms']:>8.2f} ms  "
+        f"{result['throughput_rps']:>8.1f} req/s  {result['response_bytes']:>9} B  {result['peak_alloc_kb']:>9.1f} KB"
+    )
+
+
+# Endpoints whose metric grew past threshold (relative) and min_delta (absolute, to ignore noise on
+# sub-millisecond routes) compared with the baseline; peak allocations are checked the same way
+def compare(current: dict, baseline: dict, metric: str = "p50_ms", threshold: float = 0.25,
+            min_delta_ms: float = 0.5, min_delta_kb: float = 64.0) -> List[str]:
+    previous = {result["endpoint"]: result for result in baseline["results"] if "error" not in result}
+    regressions = []
+    for result in current["results"]:
+        if "error" in result:
+            regressions.append(f"{result['endpoint']}: {result['error']}")
+            continue
+        before = previous.get(result["endpoint"])
+        if before is None:
+            continue
+        checks = [(metric, min_delta_ms, "ms"), ("peak_alloc_kb", min_delta_kb, "KB")]
+        for key, min_delta, unit in checks:
+            old, new = before.get(key), result.get(key)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + threshold) and new - old > min_delta:
+                regressions.append(f"{result['endpoint']}: {key} {old:g} -> {new:g} {unit} (+{(new / old - 1) * 100 if old else math.inf:.0f}%)")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m app.benchmark", description="Benchmark every API route in-process")
+    parser.add_argument("--match", help="Only endpoints whose name contains this text")
+    parser.add_argument("--requests", type=int, default=200, help="Timed requests per endpoint (default: 200)")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed requests per endpoint first (default: 3)")
+    parser.add_argument("--max-seconds", type=float, default=2.0, help="Stop timing an endpoint after this long (default: 2)")
+    parser.add_argument("--save", type=Path, help="Write the results to this JSON file (a new baseline)")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare with; exits 1 on regressions")
+    parser.add_argument("--metric", default="p50_ms", choices=["mean_ms", "p50_ms", "p90_ms", "p95_ms", "p99_ms"], help="Latency compared with the baseline (default: p50_ms)")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative slowdown (default: 0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.match, args.requests, args.warmup, args.max_seconds)
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(report, indent=2))
+        print(f"✅ Results saved to {args.save}")
+    errors = [result for result in report["results"] if "error" in result]
+    if args.compare:
+        regressions = compare(report, json.loads(args.compare.read_text()), args.metric, args.threshold)
+        if regressions:
+            raise SystemExit("❌ Regressions against {}:\n  {}".format(args.compare, "\n  ".join(regressions)))
+        print(f"✅ No endpoint regressed more than {args.threshold:.0%} against {args.compare}")
+    elif errors:
+        raise SystemExit(f"❌ {len(errors)} endpoint(s) failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+# app/cache.py
+import gzip
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, Optional
+
+from fastapi import HTTPException, Request, Response
+
+from app.metrics import record_cache, timed
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder produces the same JSON, just slower
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; clients are then offered gzip only
+    brotli = None
+
+# Bodies smaller than this are always sent uncompressed
+COMPRESS_MIN_BYTES = int(os.environ.get("OLYMPIQ_COMPRESS_MIN_BYTES", 1024))
+# Brotli quality 11 compresses the payloads ~20% further than 9 but takes ~20x longer at startup
+BROTLI_QUALITY = 9
+GZIP_LEVEL = 9
+# Preferred content coding when the client accepts several with the same q-value
+ENCODING_PREFERENCE = ("br", "gzip")
+
+
+# Serialize a JSON-safe object (no NaN) to compact bytes
+def dumps(obj: Any) -> bytes:
+    with timed("serialize"):
+        if orjson is not None:
+            return orjson.dumps(obj)
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+
+# A response body that has already been encoded, plus its strong ETag and, for payloads served many
+# times, compressed copies of the body by content coding ("br", "gzip")
+@dataclass(frozen=True)
+class Payload:
+    body: bytes
+    etag: str
+    media_type: str = "application/json"
+    encodings: Dict[str, bytes] = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def from_bytes(cls, body: bytes, media_type: str = "application/json") -> "Payload":
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        return cls(body=body, etag=f'"{digest}"', media_type=media_type)
+
+    @classmethod
+    def from_obj(cls, obj: Any) -> "Payload":
+        return cls.from_bytes(dumps(obj))
+
+    # Copy with gzip / brotli variants, built once; a variant is kept only when it is smaller
+    def precompressed(self) -> "Payload":
+        if len(self.body) < COMPRESS_MIN_BYTES:
+            return self
+        encodings = {"gzip": gzip.compress(self.body, compresslevel=GZIP_LEVEL, mtime=0)}
+        if brotli is not None:
+            encodings["br"] = brotli.compress(self.body, quality=BROTLI_QUALITY)
+        return replace(self, encodings={coding: body for coding, body in encodings.items() if len(body) < len(self.body)})
+
+    # Each content coding is its own representation, so it gets its own strong ETag
+    def etag_for(self, coding: Optional[str]) -> str:
+        if coding is None:
+            return self.etag
+        return f'{self.etag[:-1]}-{coding}"'
+
+
+# If-None-Match uses the weak comparison, so W/ prefixes are ignored
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+# Best content coding the client accepts among the available ones; None means identity. Identity is
+# acceptable unless refused by "identity;q=0", or by "*;q=0" without an identity entry, and only wins
+# over an available coding when listed with a higher q. A client that refuses identity and accepts
+# none of the available codings gets 406 (RFC 9110, section 12.5.3).
+def choose_encoding(accept_encoding: Optional[str], available: Iterable[str]) -> Optional[str]:
+    if not accept_encoding:
+        return None
+    qualities: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        fields = [value.strip() for value in part.split(";")]
+        quality = 1.0
+        for param in fields[1:]:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        qualities[fields[0].lower()] = quality
+    wildcard = qualities.get("*", 0.0)
+    identity = qualities.get("identity", qualities.get("*", 1.0))
+    ranked = [
+        (qualities.get(coding, wildcard), -ENCODING_PREFERENCE.index(coding), coding)
+        for coding in ENCODING_PREFERENCE
+        if coding in available
+    ]
+    ranked = [entry for entry in ranked if entry[0] > 0]
+    if ranked:
+        best = max(ranked)
+        if "identity" not in qualities or best[0] >= identity:
+            return best[2]
+    if identity > 0:
+        return None
+    offered = ", ".join([*(coding for coding in ENCODING_PREFERENCE if coding in available), "identity"])
+    raise HTTPException(status_code=406, detail=f"No acceptable content coding; available: {offered}")
+
+
+# Prefix an ETag with the version of the data it was built from, so a representation cached by a client
+# never validates against a newer data version
+def versioned_etag(etag: str, version: Optional[str]) -> str:
+    return f'"{version}-{etag[1:]}' if version else etag
+
+
+# Serve cached bytes directly (a pre-compressed variant when the client accepts one), answering
+# conditional requests with 304. vary names the request headers, besides Accept-Encoding, that
+# select the representation. ETags carry the data version the request runs on (set by
+# StoreSnapshotMiddleware in app/reload.py).
+def payload_response(request: Request, payload: Payload, vary: Iterable[str] = ()) -> Response:
+    coding = choose_encoding(request.headers.get("accept-encoding"), payload.encodings)
+    etag = versioned_etag(payload.etag_for(coding), getattr(request.state, "data_version", None))
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": ", ".join([*vary, "Accept-Encoding"])}
+    # Only GET requests (the payload routes are GET-only) are answered 304; the ETag of a POST /batch
+    # response is informational
+    if request.method == "GET" and etag_matches(request.headers.get("if-none-match"), etag):
+        record_cache("not_modified")
+        return Response(status_code=304, headers=headers)
+    # Payloads built for this request have already been recorded as a miss by the caller
+    record_cache("hit", replace=False)
+    if coding is None:
+        return Response(content=payload.body, media_type=payload.media_type, headers=headers)
+    headers["Content-Encoding"] = coding
+    return Response(content=payload.encodings[coding], media_type=payload.media_type, headers=headers)
@@ -1,15 +1,20 @@
 # clusteranalysis.py
 
 import logging
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
-from typing import List
+from typing import List, Union
 import pandas as pd
-from sklearn.preprocessing import StandardScaler
-from sklearn.cluster import KMeans
+from app.executor import compute_executor
+from app.features import build_feature_matrix, rows_to_frame
+from app.results_cache import results_cache
+from app.store import get_store
 
 router = APIRouter()
 
+# Upper bound for k; a request must also have at least k countries with complete features
+MAX_CLUSTERS = 20
+
 # Input data model for clustering
 class CountryData(BaseModel):
     country: str
@@ -22,8 +27,8 @@ class ClusterResponse(CountryData):
     cluster: int
 
 # Core clustering function
-def perform_clustering(data: List[CountryData], n_clusters: int = 4) -> pd.DataFrame:
-    df = pd.DataFrame([d.dict() for d in data])
+def perform_clustering(data: Union[List[CountryData], pd.DataFrame], n_clusters: int = 4, random_state: int = 42) -> pd.DataFrame:
+    df = data.copy() if isinstance(data, pd.DataFrame) else pd.DataFrame([d.dict() for d in data])
     if df.empty:
         raise ValueError("No data provided for clustering.")
 
@@ -32,27 +37,41 @@ def perform_clustering(data: List[CountryData], n_clusters: int = 4) -> pd.DataF
     if df_clean.empty:
         return pd.DataFrame(columns=['country', *features, 'cluster'])
 
+    # scikit-learn is imported on first use (or by the warm-up thread), not with the app
+    from sklearn.cluster import KMeans
+    from sklearn.preprocessing import StandardScaler
+
     scaler = StandardScaler()
     df_clean[features] = scaler.fit_transform(df_clean[features])
 
-    model = KMeans(n_clusters=n_clusters, random_state=42)
+    model = KMeans(n_clusters=n_clusters, random_state=random_state)
     df_clean['cluster'] = model.fit_predict(df_clean[features])
 
     return df_clean[['country', *features, 'cluster']]
 
-# API endpoint for clustering
-@router.post("/cluster", response_model=List[ClusterResponse])
-async def cluster_countries(data: List[CountryData], k: int = 4):
+# Cluster off the event loop and map the results back into Pydantic models
+async def run_clustering(data: Union[List[CountryData], pd.DataFrame], k: int) -> List[ClusterResponse]:
+    frame = data if isinstance(data, pd.DataFrame) else rows_to_frame(data)
+    samples = len(frame.dropna(subset=['population', 'psi', 'medals']))
+    if samples and k > samples:
+        raise HTTPException(status_code=422, detail=f"k={k} exceeds the {samples} countries with complete data; use k <= {samples}")
+
+    # Identical matrix + parameters -> identical result
+    key = results_cache.fingerprint(frame, kind="cluster", k=k, random_state=42)
+    cached = results_cache.get(key)
+    if cached is not None:
+        return cached
+
     try:
-        clustered_df = perform_clustering(data, n_clusters=k)
+        # KMeans runs in the compute pool so lookups keep flowing meanwhile
+        clustered_df = await compute_executor.run(perform_clustering, frame, n_clusters=k, random_state=42)
     except HTTPException as e:
         raise e  # Reraise the HTTPException
     except Exception as e:
         logging.error(f"Unexpected error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Unexpected server error: {str(e)}")
 
-    # Map clustering results back into Pydantic models
-    return [
+    result = [
         ClusterResponse(
             country=row.country,
             population=row.population,
@@ -62,3 +81,24 @@ async def cluster_countries(data: List[CountryData], k: int = 4):
         )
         for row in clustered_df.itertuples(index=False)
     ]
+    results_cache.put(key, result)
+    return result
+
+# API endpoint for clustering
+@router.post("/cluster", response_model=List[ClusterResponse])
+async def cluster_countries(data: List[CountryData], k: int = Query(4, gt=0, le=MAX_CLUSTERS)):
+    return await run_clustering(data, k)
+
+# Hit/miss counters of the clustering + PCA results cache
+@router.get("/cache")
+async def get_results_cache_stats():
+    return results_cache.stats()
+
+# Cluster the server-side (country, population, psi, medals) matrix for one year
+@router.get("/cluster", response_model=List[ClusterResponse])
+async def cluster_countries_by_year(
+    year: int = Query(..., description="Olympic year to build the feature matrix for"),
+    k: int = Query(4, gt=0, le=MAX_CLUSTERS, description="Number of clusters"),
+):
+    features = build_feature_matrix(get_store(), year)
+    return await run_clustering(features, k)
@@ -0,0 +1,107 @@
+# app/columnar.py
+#
+# Binary, column-per-file copy of a processed dataset:
+#
+#   processed/columnar/<dataset>/meta.json   column names, dtypes, country dictionary, source CSV stamp
+#   processed/columnar/<dataset>/<i>.npy     one NumPy array per column (dictionary codes for text columns)
+#
+# Arrays are memory-mapped on load, so uvicorn workers share the same pages through the OS page cache
+# instead of each parsing the CSV text.
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+COLUMNAR_DIR = Path(__file__).resolve().parent / "data" / "processed" / "columnar"
+FORMAT_VERSION = 1
+
+
+# Size + mtime of the CSV a columnar copy was built from, used to detect a stale copy
+def source_stamp(source: Path) -> dict:
+    stat = source.stat()
+    return {"file": source.name, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _codes_dtype(n_categories: int) -> str:
+    return "int16" if n_categories < np.iinfo(np.int16).max else "int32"
+
+
+def _write_array(path: Path, array: np.ndarray):
+    tmp = path.with_suffix(".tmp.npy")
+    np.save(tmp, np.ascontiguousarray(array), allow_pickle=False)
+    os.replace(tmp, path)
+
+
+# Write one typed frame; meta.json goes last so readers never see a half-written dataset
+def write_columnar(name: str, frame: pd.DataFrame, source: Optional[Path] = None, root: Path = COLUMNAR_DIR) -> Path:
+    target = root / name
+    target.mkdir(parents=True, exist_ok=True)
+
+    columns = []
+    for i, column in enumerate(frame.columns):
+        series = frame[column]
+        entry = {"name": column, "file": f"{i}.npy"}
+        if isinstance(series.dtype, pd.CategoricalDtype) or not pd.api.types.is_numeric_dtype(series.dtype):
+            categorical = series.astype("category")
+            categories = [str(value) for value in categorical.cat.categories]
+            codes = categorical.cat.codes.to_numpy().astype(_codes_dtype(len(categories)))
+            entry.update({"encoding": "dictionary", "dtype": str(codes.dtype), "dictionary": categories})
+            _write_array(target / entry["file"], codes)
+        else:
+            values = series.to_numpy()
+            entry.update({"encoding": "plain", "dtype": str(values.dtype)})
+            _write_array(target / entry["file"], values)
+        columns.append(entry)
+
+    meta = {
+        "format_version": FORMAT_VERSION,
+        "name": name,
+        "rows": len(frame),
+        "columns": columns,
+        "source": source_stamp(source) if source is not None else None,
+    }
+    tmp = target / "meta.json.tmp"
+    tmp.write_text(json.dumps(meta, ensure_ascii=False))
+    os.replace(tmp, target / "meta.json")
+    return target
+
+
+# Load a columnar dataset (memory-mapped by default); None when missing or older than its CSV
+def read_columnar(name: str, source: Optional[Path] = None, root: Path = COLUMNAR_DIR, mmap: bool = True) -> Optional[pd.DataFrame]:
+    target = root / name
+    try:
+        meta = json.loads((target / "meta.json").read_text())
+    except (OSError, ValueError):
+        return None
+    if meta.get("format_version") != FORMAT_VERSION:
+        return None
+    if source is not None and source.exists() and meta.get("source") != source_stamp(source):
+        return None
+
+    data = {}
+    for entry in meta["columns"]:
+        array = np.load(target / entry["file"], mmap_mode="r" if mmap else None, allow_pickle=False)
+        if len(array) != meta["rows"]:
+            return None
+        if entry["encoding"] == "dictionary":
+            data[entry["name"]] = pd.Categorical.from_codes(array, categories=entry["dictionary"])
+        else:
+            data[entry["name"]] = array
+    return pd.DataFrame(data, copy=False)
+
+
+# python -m app.columnar: (re)build the columnar copy of every processed CSV
+def main():
+    from app.store import DATA_DIR, DATASET_SPECS, read_csv_frame
+
+    for spec in DATASET_SPECS.values():
+        source = DATA_DIR / spec.filename
+        target = write_columnar(spec.name, read_csv_frame(spec, DATA_DIR), source=source)
+        print(f"✅ {spec.filename} -> {target.relative_to(DATA_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# app/correlation.py
+import math
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from app.store import IndicatorStore, get_store
+
+# Factors are indicator columns of the panel
+FACTORS = (
+    "gdp",
+    "gdp_per_capita",
+    "education_exp",
+    "health_exp",
+    "life_expectancy",
+    "literacy_rate",
+    "political_stability",
+    "population",
+    "urban_population",
+)
+MEDAL_TYPES = ("Gold", "Silver", "Bronze", "Total")
+# Medal type -> panel column
+MEDAL_COLUMNS = {"Gold": "gold", "Silver": "silver", "Bronze": "bronze", "Total": "total"}
+METHODS = ("pearson", "kendall")
+
+
+def _float_or_none(value) -> Optional[float]:
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+# Panel rows with a medal-table entry and a value for the factor
+def align_factor(panel: pd.DataFrame, factor: str) -> pd.DataFrame:
+    return panel[["country_id", "Year", *MEDAL_COLUMNS.values(), factor]].dropna()
+
+
+# Every factor x medal type x method result, computed once per store
+class CorrelationEngine:
+    def __init__(self, store):
+        panel = store.frame("panel")
+        self.panels: Dict[str, pd.DataFrame] = {factor: align_factor(panel, factor) for factor in FACTORS}
+        self._table: Dict[Tuple[str, str, str], Optional[dict]] = {}
+        for factor, aligned in self.panels.items():
+            for medal_type in MEDAL_TYPES:
+                for method in METHODS:
+                    self._table[(factor, medal_type, method)] = self._compute(aligned, medal_type, factor, method)
+
+    @staticmethod
+    def _compute(panel: pd.DataFrame, medal_type: str, column: str, method: str) -> Optional[dict]:
+        if panel.empty:
+            return None
+        # scipy.stats costs most of a second to import; only load it once a table is built
+        from scipy.stats import kendalltau, pearsonr
+
+        x = panel[MEDAL_COLUMNS[medal_type]]
+        y = panel[column]
+        if method == "pearson":
+            corr, p_value = pearsonr(x, y)
+        else:  # kendall
+            corr, p_value = kendalltau(x, y)
+        return {
+            "correlation_coefficient": _float_or_none(corr),
+            "p_value": _float_or_none(p_value),
+            "n_samples": len(panel),
+        }
+
+    # None when medals and the factor have no overlapping rows
+    def result(self, factor: str, medal_type: str, method: str) -> Optional[dict]:
+        return self._table[(factor, medal_type, method)]
+
+    # Factor x medal-type matrix for one method
+    def matrix(self, method: str) -> Dict[str, Dict[str, Optional[dict]]]:
+        return {
+            factor: {medal_type: self.result(factor, medal_type, method) for medal_type in MEDAL_TYPES}
+            for factor in FACTORS
+        }
+
+
+# Built once per store; pass a store to build it for one that is not published yet
+def get_correlation_engine(store: Optional[IndicatorStore] = None) -> CorrelationEngine:
+    return (store or get_store()).derived("correlations", CorrelationEngine)
@@ -0,0 +1,260 @@
+# app/countries.py
+#
+# Medal tables use Olympic team names, the World Bank / WGI sources use their own country names.
+# Every cross-indicator table is keyed by one canonical name: the Olympic name where the country
+# competes, the source name otherwise. The ETL gives each canonical country an integer id
+# (processed/countries.csv) and the processed datasets store that id instead of the name.
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+# Olympic team name -> World Bank country name, where they differ (None: no single country)
+OLYMPIC_TO_WORLD_BANK: Dict[str, Optional[str]] = {
+    "Russia": "Russian Federation",
+    "Iran": "Iran, Islamic Rep.",
+    "Egypt": "Egypt, Arab Rep.",
+    "Czech Republic": "Czechia",
+    "Hong Kong": "Hong Kong SAR, China",
+    "Turkey": "Turkiye",
+    "Syria": "Syrian Arab Republic",
+    "Venezuela": "Venezuela, RB",
+    "Vietnam": "Viet Nam",
+    "Ivory Coast": "Cote d'Ivoire",
+    "South Korea": "Korea, Rep.",
+    "North Korea": "Korea, Dem. People’s Rep.",
+    "Slovakia": "Slovak Republic",
+    "Great Britain": "United Kingdom",
+    "Chinese Taipei": "Taiwan",  # Not in the World Bank datasets
+    "Olympic Athletes from Russia": "Russian Federation",
+    "Russian Olympic Committee": "Russian Federation",
+    "Independent Olympic Athletes": None,
+    "Individual Olympic Athletes": None,
+    "Refugee Olympic Team": None,
+    "Serbia and Montenegro": "Serbia",
+    "Yugoslavia": None,
+    "Cape Verde": "Cabo Verde",
+    "Bahamas": "Bahamas, The",
+    "Saint Lucia": "St. Lucia",
+    "Kyrgyzstan": "Kyrgyz Republic",
+}
+
+# IOC country code -> Olympic team name, for medal tables that list NOCs instead of names
+NOC_TO_COUNTRY: Dict[str, str] = {
+    "NOR": "Norway",
+    "GER": "Germany",
+    "USA": "United States",
+    "CAN": "Canada",
+    "RUS": "Russia",
+    "FRA": "France",
+    "ITA": "Italy",
+    "FIN": "Finland",
+    "MRI": "Mauritius",
+    "EGY": "Egypt",
+    "GBR": "Great Britain",
+    "CRO": "Croatia",
+    "CMR": "Cameroon",
+    "IRL": "Ireland",
+    "TKM": "Turkmenistan",
+    "PAK": "Pakistan",
+    "GRN": "Grenada",
+    "CZE": "Czech Republic",
+    "BEL": "Belgium",
+    "JAM": "Jamaica",
+    "ESP": "Spain",
+    "COL": "Colombia",
+    "SUD": "Sudan",
+    "NIG": "Niger",
+    "SVK": "Slovakia",
+    "MKD": "North Macedonia",
+    "BAR": "Barbados",
+    "NAM": "Namibia",
+    "QAT": "Qatar",
+    "CIV": "Ivory Coast",
+    "BUR": "Burkina Faso",
+    "JPN": "Japan",
+    "NGR": "Nigeria",
+    "CPV": "Cape Verde",
+    "KAZ": "Kazakhstan",
+    "MAR": "Morocco",
+    "ROU": "Romania",
+    "KOR": "South Korea",
+    "URU": "Uruguay",
+    "HUN": "Hungary",
+    "IRI": "Iran",
+    "SAM": "Samoa",
+    "ECU": "Ecuador",
+    "TUN": "Tunisia",
+    "SIN": "Singapore",
+    "INA": "Indonesia",
+    "ALG": "Algeria",
+    "MGL": "Mongolia",
+    "BRN": "Bahrain",
+    "ALB": "Albania",
+    "ZAM": "Zambia",
+    "IND": "India",
+    "TTO": "Trinidad and Tobago",
+    "PAN": "Panama",
+    "BER": "Bermuda",
+    "KSA": "Saudi Arabia",
+    "ISR": "Israel",
+    "RSA": "South Africa",
+    "AUT": "Austria",
+    "NED": "Netherlands",
+    "FIJ": "Fiji",
+    "ERI": "Eritrea",
+    "LCA": "Saint Lucia",
+    "ROC": "Russian Olympic Committee",
+    "BRA": "Brazil",
+    "SRI": "Sri Lanka",
+    "KGZ": "Kyrgyzstan",
+    "BUL": "Bulgaria",
+    "BDI": "Burundi",
+    "DEN": "Denmark",
+    "MAS": "Malaysia",
+    "POR": "Portugal",
+    "NZL": "New Zealand",
+    "LVA": "Latvia",
+    "GEO": "Georgia",
+    "IOA": "Individual Olympic Athletes",
+    "BAH": "Bahamas",
+    "UZB": "Uzbekistan",
+    "SUI": "Switzerland",
+    "KUW": "Kuwait",
+    "AZE": "Azerbaijan",
+    "MNE": "Montenegro",
+    "PAR": "Paraguay",
+    "GAB": "Gabon",
+    "SLO": "Slovenia",
+    "AUS": "Australia",
+    "CYP": "Cyprus",
+    "AIN": "Independent Olympic Athletes",
+    "UAE": "United Arab Emirates",
+    "HKG": "Hong Kong",
+    "BOT": "Botswana",
+    "SMR": "San Marino",
+    "TJK": "Tajikistan",
+    "LIE": "Liechtenstein",
+    "SCG": "Serbia and Montenegro",
+    "CHI": "Chile",
+    "SYR": "Syria",
+    "CUB": "Cuba",
+    "CHN": "China",
+    "SWE": "Sweden",
+    "JOR": "Jordan",
+    "VIE": "Vietnam",
+    "DOM": "Dominican Republic",
+    "PRK": "North Korea",
+    "TUR": "Turkey",
+    "MEX": "Mexico",
+    "OAR": "Olympic Athletes from Russia",
+    "GUA": "Guatemala",
+    "GRE": "Greece",
+    "ZIM": "Zimbabwe",
+    "SRB": "Serbia",
+    "GHA": "Ghana",
+    "UGA": "Uganda",
+    "PER": "Peru",
+    "TPE": "Chinese Taipei",
+    "TOG": "Togo",
+    "ISL": "Iceland",
+    "THA": "Thailand",
+    "YUG": "Yugoslavia",
+    "ROT": "Refugee Olympic Team",
+    "ARM": "Armenia",
+    "EST": "Estonia",
+    "SGP": "Singapore",
+    "LAT": "Latvia",
+    "POL": "Poland",
+    "AFG": "Afghanistan",
+    "PUR": "Puerto Rico",
+    "CRC": "Costa Rica",
+    "VEN": "Venezuela",
+    "KEN": "Kenya",
+    "PHI": "Philippines",
+    "MDA": "Moldova",
+    "UKR": "Ukraine",
+    "BLR": "Belarus",
+    "ARG": "Argentina",
+    "LTU": "Lithuania",
+    "ETH": "Ethiopia",
+    "DMA": "Dominica",
+    "MOZ": "Mozambique",
+    "KOS": "Kosovo",
+}
+
+# Teams that competed for a country under another name in some Games
+OLYMPIC_ALIASES: Dict[str, str] = {
+    "Olympic Athletes from Russia": "Russia",
+    "Russian Olympic Committee": "Russia",
+    "Serbia and Montenegro": "Serbia",
+}
+
+WORLD_BANK_TO_OLYMPIC: Dict[str, str] = {
+    world_bank: olympic
+    for olympic, world_bank in OLYMPIC_TO_WORLD_BANK.items()
+    if world_bank is not None and olympic not in OLYMPIC_ALIASES
+}
+
+# Case-folded source spelling -> canonical name, for every spelling that differs from its canonical name
+_CANONICAL = {name.casefold(): canonical for name, canonical in {**WORLD_BANK_TO_OLYMPIC, **OLYMPIC_ALIASES}.items()}
+
+
+# Canonical name for a country as spelled by any source (medal tables or indicators)
+def canonical_country(name: str) -> str:
+    name = name.strip()
+    return _CANONICAL.get(name.casefold(), name)
+
+
+COUNTRIES_FILENAME = "countries.csv"
+# Columns of processed/countries.csv; aliases are "|"-separated
+DIMENSION_COLUMNS = ["country_id", "name", "noc", "olympic_name", "world_bank_name", "iso3", "aliases"]
+
+
+# The country dimension written by the ETL (processed/countries.csv): one row and a stable integer id
+# per country, with every spelling the sources use for it
+class CountryDimension:
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        self.names: Dict[int, str] = dict(zip(frame["country_id"].tolist(), frame["name"].tolist()))
+        self._label_dtypes: Dict[str, pd.CategoricalDtype] = {}
+        # Case-folded spelling -> id; names win over codes when a spelling is ambiguous
+        self._ids: Dict[str, int] = {}
+        for column in ["name", "olympic_name", "world_bank_name", "aliases", "noc", "iso3"]:
+            for country_id, value in zip(frame["country_id"].tolist(), frame[column].tolist()):
+                if not isinstance(value, str):
+                    continue
+                spellings = value.split("|") if column == "aliases" else [value]
+                for spelling in spellings:
+                    if spelling.strip():
+                        self._ids.setdefault(spelling.strip().casefold(), country_id)
+
+    @classmethod
+    def load(cls, path) -> "CountryDimension":
+        frame = pd.read_csv(path, dtype={"country_id": "int16"}, keep_default_na=False, na_values=[""])
+        return cls(frame.sort_values("country_id", ignore_index=True))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    # Id for any name, alias, NOC or ISO3 code; None when the country is unknown
+    def resolve(self, country: str) -> Optional[int]:
+        return self._ids.get(country.strip().casefold())
+
+    def name(self, country_id: int) -> str:
+        return self.names[country_id]
+
+    # Categorical "Country" labels for an array of ids: the value of one dimension column, the canonical
+    # name where that column is empty. Every dataset labelled from the same column shares one dtype, so
+    # each label string is held once per process.
+    def labels(self, ids: np.ndarray, column: str) -> pd.Categorical:
+        dtype = self._label_dtypes.get(column)
+        if dtype is None:
+            values = self.frame[column].where(self.frame[column].notna(), self.frame["name"])
+            dtype = self._label_dtypes[column] = pd.CategoricalDtype(pd.Index(values.tolist(), dtype="str"))
+        codes = np.searchsorted(self.frame["country_id"].to_numpy(), ids)
+        return pd.Categorical.from_codes(codes, dtype=dtype)
+
+    def shared_bytes(self) -> int:
+        labels = sum(dtype.categories.memory_usage(deep=True) for dtype in self._label_dtypes.values())
+        return int(self.frame.memory_usage(index=True, deep=True).sum()) + labels
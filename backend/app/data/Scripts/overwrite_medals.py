@@ -1,166 +0,0 @@
-import os
-import pandas as pd
-
-noc_to_country = {
-    "NOR": "Norway",
-    "GER": "Germany",
-    "USA": "United States",
-    "CAN": "Canada",
-    "RUS": "Russia",
-    "FRA": "France",
-    "ITA": "Italy",
-    "FIN": "Finland",
-    "MRI": "Mauritius",
-    "EGY": "Egypt",
-    "GBR": "Great Britain",
-    "CRO": "Croatia",
-    "CMR": "Cameroon",
-    "IRL": "Ireland",
-    "TKM": "Turkmenistan",
-    "PAK": "Pakistan",
-    "GRN": "Grenada",
-    "CZE": "Czech Republic",
-    "BEL": "Belgium",
-    "JAM": "Jamaica",
-    "ESP": "Spain",
-    "COL": "Colombia",
-    "SUD": "Sudan",
-    "NIG": "Niger",
-    "SVK": "Slovakia",
-    "MKD": "North Macedonia",
-    "BAR": "Barbados",
-    "NAM": "Namibia",
-    "QAT": "Qatar",
-    "CIV": "Ivory Coast",
-    "BUR": "Burkina Faso",
-    "JPN": "Japan",
-    "NGR": "Nigeria",
-    "CPV": "Cape Verde",
-    "KAZ": "Kazakhstan",
-    "MAR": "Morocco",
-    "ROU": "Romania",
-    "KOR": "South Korea",
-    "URU": "Uruguay",
-    "HUN": "Hungary",
-    "IRI": "Iran",
-    "SAM": "Samoa",
-    "ECU": "Ecuador",
-    "TUN": "Tunisia",
-    "SIN": "Singapore",
-    "INA": "Indonesia",
-    "ALG": "Algeria",
-    "MGL": "Mongolia",
-    "BRN": "Bahrain",
-    "ALB": "Albania",
-    "ZAM": "Zambia",
-    "IND": "India",
-    "TTO": "Trinidad and Tobago",
-    "PAN": "Panama",
-    "BER": "Bermuda",
-    "KSA": "Saudi Arabia",
-    "ISR": "Israel",
-    "RSA": "South Africa",
-    "AUT": "Austria",
-    "NED": "Netherlands",
-    "FIJ": "Fiji",
-    "ERI": "Eritrea",
-    "LCA": "Saint Lucia",
-    "ROC": "Russian Olympic Committee",
-    "BRA": "Brazil",
-    "SRI": "Sri Lanka",
-    "KGZ": "Kyrgyzstan",
-    "BUL": "Bulgaria",
-    "BDI": "Burundi",
-    "DEN": "Denmark",
-    "MAS": "Malaysia",
-    "POR": "Portugal",
-    "NZL": "New Zealand",
-    "LVA": "Latvia",
-    "GEO": "Georgia",
-    "IOA": "Individual Olympic Athletes",
-    "BAH": "Bahamas",
-    "UZB": "Uzbekistan",
-    "SUI": "Switzerland",
-    "KUW": "Kuwait",
-    "AZE": "Azerbaijan",
-    "MNE": "Montenegro",
-    "PAR": "Paraguay",
-    "GAB": "Gabon",
-    "SLO": "Slovenia",
-    "AUS": "Australia",
-    "CYP": "Cyprus",
-    "AIN": "Independent Olympic Athletes",
-    "UAE": "United Arab Emirates",
-    "HKG": "Hong Kong",
-    "BOT": "Botswana",
-    "SMR": "San Marino",
-    "TJK": "Tajikistan",
-    "LIE": "Liechtenstein",
-    "SCG": "Serbia and Montenegro",
-    "CHI": "Chile",
-    "SYR": "Syria",
-    "CUB": "Cuba",
-    "CHN": "China",
-    "SWE": "Sweden",
-    "JOR": "Jordan",
-    "VIE": "Vietnam",
-    "DOM": "Dominican Republic",
-    "PRK": "North Korea",
-    "TUR": "Turkey",
-    "MEX": "Mexico",
-    "OAR": "Olympic Athletes from Russia",
-    "GUA": "Guatemala",
-    "GRE": "Greece",
-    "ZIM": "Zimbabwe",
-    "SRB": "Serbia",
-    "GHA": "Ghana",
-    "UGA": "Uganda",
-    "PER": "Peru",
-    "TPE": "Chinese Taipei",
-    "TOG": "Togo",
-    "ISL": "Iceland",
-    "THA": "Thailand",
-    "YUG": "Yugoslavia",
-    "ROT": "Refugee Olympic Team",
-    "ARM": "Armenia",
-    "EST": "Estonia",
-    "SGP": "Singapore",
-    "LAT": "Latvia",
-    "POL": "Poland",
-    "AFG": "Afghanistan",
-    "PUR": "Puerto Rico",
-    "CRC": "Costa Rica",
-    "VEN": "Venezuela",
-    "KEN": "Kenya",
-    "PHI": "Philippines",
-    "MDA": "Moldova",
-    "UKR": "Ukraine",
-    "BLR": "Belarus",
-    "ARG": "Argentina",
-    "LTU": "Lithuania",
-    "ETH": "Ethiopia",
-    "DMA": "Dominica",
-    "MOZ": "Mozambique",
-    "KOS": "Kosovo"
-}
-
-folder = r'c:\Users\HP\Documents\GitHub\OlympiQ\data\raw\medals'
-
-# unique_nocs = set() # Set to store unique NOCs
-
-for filename in os.listdir(folder):
-    if filename.endswith('.csv'):
-        filepath = os.path.join(folder, filename)
-        df = pd.read_csv(filepath)
-        if 'NOC' in df.columns:
-            # unique_nocs.update(df['NOC'].unique())
-            df.rename(columns={'NOC': 'Country'}, inplace=True)
-        df['Country'] = df['Country'].map(noc_to_country).fillna(df['Country']) 
-        df.to_csv(filepath, index=False)
-
-        print(f"✅ Cleaned and saved: {filename}")
-
-# unmapped_nocs = unique_nocs - set(noc_to_country.keys())
-# print("\n Unmapped NOCs:")  
-# print(unmapped_nocs)
-
@@ -1,12 +1,13 @@
 # app/dimensionality_reduction.py
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 from pydantic import BaseModel
-from sklearn.decomposition import PCA
-from sklearn.manifold import TSNE
-from sklearn.preprocessing import StandardScaler
 import numpy as np
 import pandas as pd
-from typing import List
+from typing import List, Union
+from app.executor import compute_executor
+from app.features import build_feature_matrix, rows_to_frame
+from app.results_cache import results_cache
+from app.store import get_store
 
 router = APIRouter()
 
@@ -25,19 +26,26 @@ class DimensionalityReductionResponse(BaseModel):
     cluster: int
 
 # Function for PCA (Principal Component Analysis)
-def perform_pca(data: List[CountryData], n_components: int = 2):
+def perform_pca(data: Union[List[CountryData], pd.DataFrame], n_components: int = 2):
     # Convert data into a Pandas DataFrame
-    df = pd.DataFrame([{
-        'country': d.country,
-        'population': d.population,
-        'psi': d.psi,
-        'medals': d.medals
-    } for d in data])
+    if isinstance(data, pd.DataFrame):
+        df = data[['country', 'population', 'psi', 'medals']].copy()
+    else:
+        df = pd.DataFrame([{
+            'country': d.country,
+            'population': d.population,
+            'psi': d.psi,
+            'medals': d.medals
+        } for d in data])
     
     # Prepare the features for PCA
     features = ['population', 'psi', 'medals']
     X = df[features].values
     
+    # scikit-learn is imported on first use (or by the warm-up thread), not with the app
+    from sklearn.decomposition import PCA
+    from sklearn.preprocessing import StandardScaler
+
     # Standardize the data (important for PCA)
     scaler = StandardScaler()
     X_scaled = scaler.fit_transform(X)
@@ -53,18 +61,29 @@ def perform_pca(data: List[CountryData], n_components: int = 2):
     # Return the result
     return df
 
-# Define the route for PCA
-@router.post("/pca", response_model=List[DimensionalityReductionResponse])
-async def pca(data: List[CountryData]):
-    # Perform PCA on the received data
-    pca_result = perform_pca(data)
+# PCA followed by KMeans on the two components
+def perform_pca_clustering(data: Union[List[CountryData], pd.DataFrame], n_components: int = 2, n_clusters: int = 4, random_state: int = 42):
+    pca_result = perform_pca(data, n_components=n_components)
     
-    # Create clusters based on PCA
+    # Create clusters based on PCA; seeded so identical inputs give identical (cacheable) results
     from sklearn.cluster import KMeans
-    kmeans = KMeans(n_clusters=4)
+    kmeans = KMeans(n_clusters=n_clusters, random_state=random_state)
     pca_result['cluster'] = kmeans.fit_predict(pca_result[['pca1', 'pca2']])
+    return pca_result
+
+# Run PCA + clustering off the event loop and prepare the response
+async def run_pca(data: Union[List[CountryData], pd.DataFrame]) -> List[DimensionalityReductionResponse]:
+    frame = data if isinstance(data, pd.DataFrame) else rows_to_frame(data)
+
+    # Identical matrix + parameters -> identical result
+    params = {"n_components": 2, "n_clusters": 4, "random_state": 42}
+    key = results_cache.fingerprint(frame, kind="pca", **params)
+    cached = results_cache.get(key)
+    if cached is not None:
+        return cached
+
+    pca_result = await compute_executor.run(perform_pca_clustering, frame, **params)
     
-    # Prepare the response
     result = [
         DimensionalityReductionResponse(
             country=row['country'],
@@ -75,5 +94,15 @@ async def pca(data: List[CountryData]):
         )
         for _, row in pca_result.iterrows()
     ]
-    
+    results_cache.put(key, result)
     return result
+
+# Define the route for PCA
+@router.post("/pca", response_model=List[DimensionalityReductionResponse])
+async def pca(data: List[CountryData]):
+    return await run_pca(data)
+
+# PCA of the server-side (country, population, psi, medals) matrix for one year
+@router.get("/pca", response_model=List[DimensionalityReductionResponse])
+async def pca_by_year(year: int = Query(..., description="Olympic year to build the feature matrix for")):
+    return await run_pca(build_feature_matrix(get_store(), year))
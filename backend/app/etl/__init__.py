@@ -0,0 +1 @@
+# app/etl: rebuilds app/data/processed from app/data/RAW (python -m app.etl)
@@ -0,0 +1,69 @@
+# app/etl/countries.py
+#
+# Builds processed/countries.csv: one row per canonical country that appears in the medal table.
+# Ids already present in the previous countries.csv are kept, so processed files and clients can
+# rely on them across runs; new countries get the next free ids.
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import pandas as pd
+
+from app.countries import (
+    DIMENSION_COLUMNS,
+    NOC_TO_COUNTRY,
+    OLYMPIC_ALIASES,
+    OLYMPIC_TO_WORLD_BANK,
+    canonical_country,
+)
+
+
+# World Bank country name -> ISO3 code, from any DataBank export ("Country Name", "Country Code")
+def world_bank_codes(path: Path) -> Dict[str, str]:
+    df = pd.read_csv(path, usecols=["Country Name", "Country Code"]).dropna().drop_duplicates("Country Name")
+    return dict(zip(df["Country Name"].str.strip(), df["Country Code"].str.strip()))
+
+
+def build_country_dimension(
+    medal_countries: Iterable[str],
+    iso_codes: Dict[str, str],
+    previous: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    # Every Olympic spelling of each canonical country (team names, NOC codes)
+    spellings: Dict[str, set] = {}
+    for team in medal_countries:
+        spellings.setdefault(canonical_country(team), set()).add(team)
+    nocs: Dict[str, list] = {}
+    for noc, team in NOC_TO_COUNTRY.items():
+        nocs.setdefault(team, []).append(noc)
+    for alias, canonical in OLYMPIC_ALIASES.items():
+        if canonical in spellings:
+            spellings[canonical].add(alias)
+
+    ids: Dict[str, int] = {}
+    if previous is not None and len(previous):
+        ids = dict(zip(previous["name"], previous["country_id"].astype(int)))
+    next_id = max(ids.values(), default=0) + 1
+
+    rows = []
+    for name in sorted(spellings):
+        if name not in ids:
+            ids[name] = next_id
+            next_id += 1
+        world_bank_name = OLYMPIC_TO_WORLD_BANK.get(name, name)
+        if world_bank_name not in iso_codes:
+            world_bank_name = None
+        aliases = sorted(spellings[name] - {name})
+        # Codes of the alias teams, and older codes of the country itself (LAT / LVA, ...)
+        aliases += [noc for alias in aliases for noc in nocs.get(alias, [])] + nocs.get(name, [])[1:]
+        rows.append({
+            "country_id": ids[name],
+            "name": name,
+            "noc": (nocs.get(name) or [None])[0],
+            "olympic_name": name,
+            "world_bank_name": world_bank_name,
+            "iso3": iso_codes.get(world_bank_name) if world_bank_name else None,
+            "aliases": "|".join(aliases),
+        })
+    dimension = pd.DataFrame(rows, columns=DIMENSION_COLUMNS).sort_values("country_id", ignore_index=True)
+    dimension["country_id"] = dimension["country_id"].astype("int16")
+    return dimension
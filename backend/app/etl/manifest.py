@@ -0,0 +1,53 @@
+# app/etl/manifest.py
+#
+# Record of what every ETL output was last built from (processed/.etl/manifest.json):
+#
+#   {"etl_version": 1, "outputs": {"gdp": {"version": "...", "inputs": {"raw": "<digest>", "countries": "<digest>"}}, ...}}
+#
+# An output is rebuilt only when its file is missing or the recorded inputs / version differ.
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict
+
+# Bump when the cleaning logic changes in a way that alters outputs
+ETL_VERSION = 3
+
+
+# Content hash of a file, read in chunks
+def file_digest(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Manifest:
+    def __init__(self, path: Path, outputs: Dict[str, dict]):
+        self.path = path
+        self.outputs = outputs
+
+    # A manifest written by another ETL version is ignored, so everything is rebuilt once
+    @classmethod
+    def load(cls, path: Path) -> "Manifest":
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return cls(path, {})
+        if data.get("etl_version") != ETL_VERSION:
+            return cls(path, {})
+        return cls(path, data.get("outputs", {}))
+
+    def is_fresh(self, output: str, version: str, inputs: Dict[str, str]) -> bool:
+        return self.outputs.get(output) == {"version": version, "inputs": inputs}
+
+    def record(self, output: str, version: str, inputs: Dict[str, str]):
+        self.outputs[output] = {"version": version, "inputs": inputs}
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"etl_version": ETL_VERSION, "outputs": self.outputs}, indent=2, sort_keys=True))
+        os.replace(tmp, self.path)
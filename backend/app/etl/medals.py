@@ -0,0 +1,92 @@
+# app/etl/medals.py
+#
+# Merge the per-Games medal tables (RAW/Medals/medals_<year>.csv) into processed/medals.csv.
+# RAW files are never modified: NOC codes are resolved to team names in the merged table.
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.countries import NOC_TO_COUNTRY
+from app.etl.sources import RAW_DIR
+
+MEDALS_DIR = RAW_DIR / "Medals"
+MEDAL_FILE_PATTERN = "medals_*.csv"
+COUNT_COLUMNS = ["Gold", "Silver", "Bronze", "Total"]
+MEDAL_COLUMNS = ["Country", *COUNT_COLUMNS, "Year"]
+
+
+class MedalSchemaError(ValueError):
+    pass
+
+
+def medal_files(medals_dir: Path = MEDALS_DIR) -> List[Path]:
+    return sorted(medals_dir.glob(MEDAL_FILE_PATTERN))
+
+
+def _read_medal_file(path: Path) -> pd.DataFrame:
+    df = pd.read_csv(path)
+    df.columns = df.columns.str.strip()
+    # Older exports name the team column by its NOC code
+    return df.rename(columns={"NOC": "Country"})
+
+
+# Team names for a column of names and/or NOC codes; each distinct value is looked up once
+def resolve_countries(values: pd.Series) -> pd.Series:
+    categorical = values.astype("category")
+    categories = categorical.cat.categories
+    resolved = np.asarray([NOC_TO_COUNTRY.get(value, value) for value in categories], dtype=object)
+    return pd.Series(resolved[categorical.cat.codes.to_numpy()], index=values.index, dtype="str")
+
+
+# Every problem found in the merged table at once, so a bad drop of new files is fixed in one go
+def validate_medals(frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    errors = [
+        f"{name}: missing columns {[column for column in MEDAL_COLUMNS if column not in df.columns]}"
+        for name, df in frames.items()
+        if not set(MEDAL_COLUMNS) <= set(df.columns)
+    ]
+    if errors:
+        raise MedalSchemaError("; ".join(errors))
+
+    merged = pd.concat(
+        [df[MEDAL_COLUMNS].assign(_file=name) for name, df in frames.items()],
+        ignore_index=True,
+    )
+    numbers = merged[[*COUNT_COLUMNS, "Year"]].apply(pd.to_numeric, errors="coerce")
+    checks = {
+        "non-numeric or empty counts": numbers.isna().any(axis=1),
+        "negative counts": (numbers[COUNT_COLUMNS] < 0).any(axis=1),
+        "Total != Gold + Silver + Bronze": numbers["Total"] != numbers[["Gold", "Silver", "Bronze"]].sum(axis=1),
+        "Year does not match the file name": numbers["Year"] != pd.to_numeric(merged["_file"].str.extract(r"(\d{4})", expand=False)),
+        "empty country": merged["Country"].isna(),
+    }
+    for problem, failed in checks.items():
+        if failed.any():
+            rows = merged.loc[failed, "_file"].value_counts().to_dict()
+            errors.append(f"{problem} ({rows})")
+    if errors:
+        raise MedalSchemaError("; ".join(errors))
+
+    merged[[*COUNT_COLUMNS, "Year"]] = numbers.astype("int64")
+    return merged
+
+
+# The merged, validated medal table sorted by (Country, Year)
+def merge_medals(paths: List[Path], workers: Optional[int] = None) -> pd.DataFrame:
+    if not paths:
+        raise MedalSchemaError(f"No {MEDAL_FILE_PATTERN} files found")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        frames = dict(zip((path.name for path in paths), pool.map(_read_medal_file, paths)))
+
+    merged = validate_medals(frames)
+    merged["Country"] = resolve_countries(merged["Country"].str.strip())
+
+    duplicated = merged.duplicated(["Country", "Year"], keep=False)
+    if duplicated.any():
+        pairs = sorted(set(zip(merged.loc[duplicated, "Country"], merged.loc[duplicated, "Year"])))
+        raise MedalSchemaError(f"Several rows for the same team and Games: {pairs}")
+
+    return merged[MEDAL_COLUMNS].sort_values(by=["Country", "Year"], ignore_index=True)
@@ -0,0 +1,261 @@
+# app/etl/pipeline.py
+#
+# Rebuild processed/ from RAW/ in one run:
+#
+#   1. merge RAW/Medals/medals_*.csv into processed/medals.csv when any year file changed (medals.py) and
+#      give every country an integer id in processed/countries.csv (countries.py)
+#   2. hash every raw file and processed/countries.csv, skip sources whose inputs are unchanged (manifest.py)
+#   3. clean the remaining sources in parallel (one process per source), parsing each raw file only when
+#      its content changed; otherwise the cached extract in processed/.etl/extracts/ is reused. Outputs
+#      store the country id in place of the country name
+#   4. rebuild panel.csv and the columnar copies that are now out of date
+import argparse
+import hashlib
+import os
+import re
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from app.columnar import read_columnar, write_columnar
+from app.countries import COUNTRIES_FILENAME, OLYMPIC_TO_WORLD_BANK, CountryDimension, canonical_country
+from app.etl.countries import build_country_dimension, world_bank_codes
+from app.etl.manifest import ETL_VERSION, Manifest, file_digest
+from app.etl.medals import MEDALS_DIR, MedalSchemaError, medal_files, merge_medals
+from app.etl.sources import SOURCES, YEAR_RANGE, SourceSpec
+from app.etl.wgi import wgi_indicator
+from app.panel import PANEL_COLUMNS, PANEL_FILENAME, write_panel
+from app.store import DATA_DIR, DATASET_SPECS, read_csv_frame
+
+# Metadata columns of World Bank exports that are not part of the output
+METADATA_COLUMNS = ["Series Name", "Series Code", "Country Code", "Indicator Name", "Indicator Code"]
+
+
+def _drop_metadata(df: pd.DataFrame) -> pd.DataFrame:
+    df.columns = df.columns.str.strip()
+    return df.drop(columns=[column for column in METADATA_COLUMNS if column in df.columns])
+
+
+# DataBank export: Series/Country columns followed by "2000 [YR2000]" ... year columns
+def read_databank(spec: SourceSpec) -> pd.DataFrame:
+    df = _drop_metadata(pd.read_csv(spec.raw_path, na_values=".."))
+    df = df.rename(columns={"Country Name": "Country"})
+    df = df.melt(id_vars=["Country"], var_name="Year", value_name=spec.value_column)
+    df["Year"] = df["Year"].str.extract(r"(\d{4})")
+    return df
+
+
+# WDI download: four preamble lines, then Country/Indicator columns and plain "2000" ... year columns
+def read_wdi(spec: SourceSpec) -> pd.DataFrame:
+    df = _drop_metadata(pd.read_csv(spec.raw_path, skiprows=4, na_values=".."))
+    df = df.rename(columns={"Country Name": "Country"})
+    df = df.melt(id_vars=["Country"], var_name="Year", value_name=spec.value_column)
+    return df[df["Year"].astype(str).str.isdigit()]
+
+
+# The "wgi" layout is read through app/etl/wgi.py, which keeps its own extract of the workbook
+READERS = {
+    "databank": read_databank,
+    "wdi": read_wdi,
+}
+
+
+# Manifest and extract cache live next to the outputs
+def etl_dir(data_dir: Path) -> Path:
+    return data_dir / ".etl"
+
+
+# A source parsed into (Country, Year, value) rows before any filtering. Parsing is cached per raw-file
+# digest and spec, so a source whose raw file did not change is never parsed again (only re-filtered).
+def load_extract(spec: SourceSpec, raw_digest: str, cache_root: Path) -> pd.DataFrame:
+    key = hashlib.blake2b(f"{raw_digest}:{spec!r}:{ETL_VERSION}".encode(), digest_size=16).hexdigest()
+    name = f"{spec.name}-{key}"
+    extract = read_columnar(name, root=cache_root, mmap=False)
+    if extract is not None:
+        # Text columns come back dictionary-encoded
+        return extract.astype({column: "str" for column in extract.columns if extract[column].dtype == "category"})
+
+    if spec.layout == "wgi":
+        extract = wgi_indicator(spec.raw_path, spec.wgi_indicator, spec.value_column, cache_root, raw_digest)
+    else:
+        extract = READERS[spec.layout](spec)
+    write_columnar(name, extract, root=cache_root)
+    for old in cache_root.glob(f"{spec.name}-*"):
+        if old.name != name:
+            shutil.rmtree(old, ignore_errors=True)
+    return extract
+
+
+# Source spelling of each Olympic country (World Bank names where they differ)
+def source_country_names(olympic_countries: Iterable[str]) -> Dict[str, str]:
+    names = {OLYMPIC_TO_WORLD_BANK.get(country, country): country for country in olympic_countries}
+    names.pop(None, None)
+    return names
+
+
+def write_csv_atomic(frame: pd.DataFrame, path: Path):
+    tmp = path.with_name(path.name + ".tmp")
+    frame.to_csv(tmp, index=False)
+    os.replace(tmp, path)
+
+
+# Clean one source and write its processed CSV (country_id, Year, value); runs in a worker process.
+# country_ids maps every canonical country name to its id.
+def clean_source(spec: SourceSpec, raw_digest: str, country_ids: Dict[str, int], data_dir: Path = DATA_DIR) -> dict:
+    started = time.perf_counter()
+    df = load_extract(spec, raw_digest, etl_dir(data_dir) / "extracts")
+    if spec.dropna:
+        df = df.dropna(subset=[spec.value_column])
+    df = df[df["Year"].astype(int).between(*YEAR_RANGE)]
+
+    source_names = source_country_names(country_ids)
+    df = df[df["Country"].isin(source_names)]
+    if spec.sort:
+        # Rows are ordered by the label the store shows for them (DatasetSpec.country_names)
+        labels = df["Country"].map(canonical_country) if spec.dataset.country_names == "name" else df["Country"]
+        df = df.assign(_label=labels).sort_values(by=["_label", "Year"]).drop(columns="_label")
+    df.insert(0, "country_id", df.pop("Country").map(source_names).map(country_ids).astype("int16"))
+
+    write_csv_atomic(df, data_dir / spec.dataset.filename)
+    present = set(df["country_id"].unique().tolist())
+    missing = {country for country in source_names.values() if country_ids[country] not in present}
+    return {
+        "source": spec.name,
+        "output": spec.dataset.filename,
+        "rows": len(df),
+        "missing": sorted(missing),
+        "seconds": time.perf_counter() - started,
+        "rebuilt": True,
+    }
+
+
+# processed/medals.csv and processed/countries.csv when a year file was added, removed or changed.
+# ISO3 codes come from the population export, which lists every World Bank country.
+def build_medals(manifest: Manifest, data_dir: Path = DATA_DIR, force: bool = False, medals_dir: Path = MEDALS_DIR) -> dict:
+    paths = medal_files(medals_dir)
+    codes_path = SOURCES["population"].raw_path
+    inputs = {path.name: file_digest(path) for path in paths}
+    inputs["iso3"] = file_digest(codes_path)
+    output = data_dir / DATASET_SPECS["medals"].filename
+    countries_path = data_dir / COUNTRIES_FILENAME
+    if not force and output.exists() and countries_path.exists() and manifest.is_fresh("medals", "medals", inputs):
+        return {"source": "medals", "output": output.name, "rebuilt": False}
+
+    started = time.perf_counter()
+    merged = merge_medals(paths)
+    # Ids already handed out are kept, even with --force
+    previous = CountryDimension.load(countries_path).frame if countries_path.exists() else None
+    dimension = build_country_dimension(merged["Country"].unique(), world_bank_codes(codes_path), previous)
+    ids = dict(zip(dimension["name"], dimension["country_id"]))
+    merged.insert(0, "country_id", merged["Country"].map(canonical_country).map(ids).astype("int16"))
+    write_csv_atomic(dimension, countries_path)
+    write_csv_atomic(merged, output)
+    manifest.record("medals", "medals", inputs)
+    # Three-letter codes left after resolution are NOCs missing from NOC_TO_COUNTRY
+    unresolved = sorted(country for country in merged["Country"].unique() if re.fullmatch(r"[A-Z]{3}", country))
+    return {
+        "source": "medals",
+        "output": f"{output.name}, {countries_path.name}",
+        "rows": len(merged),
+        "missing": unresolved,
+        "seconds": time.perf_counter() - started,
+        "rebuilt": True,
+    }
+
+
+# panel.csv when any of its input CSVs or countries.csv changed, then every columnar copy older than its CSV
+def rebuild_derived(manifest: Manifest, data_dir: Path = DATA_DIR, force: bool = False) -> List[str]:
+    rebuilt = []
+    panel_inputs = {
+        name: file_digest(data_dir / DATASET_SPECS[name].filename)
+        for name in sorted({dataset for dataset, _ in PANEL_COLUMNS.values()})
+    }
+    # Rows are ordered by country name
+    panel_inputs["countries"] = file_digest(data_dir / COUNTRIES_FILENAME)
+    if force or not (data_dir / PANEL_FILENAME).exists() or not manifest.is_fresh("panel", "panel", panel_inputs):
+        write_panel(data_dir)
+        manifest.record("panel", "panel", panel_inputs)
+        rebuilt.append(PANEL_FILENAME)
+
+    columnar_root = data_dir / "columnar"
+    for spec in DATASET_SPECS.values():
+        source = data_dir / spec.filename
+        if force or read_columnar(spec.name, source=source, root=columnar_root) is None:
+            write_columnar(spec.name, read_csv_frame(spec, data_dir), source=source, root=columnar_root)
+            rebuilt.append(f"columnar/{spec.name}")
+    return rebuilt
+
+
+def run_pipeline(
+    names: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    data_dir: Path = DATA_DIR,
+    force: bool = False,
+) -> Tuple[List[dict], List[str]]:
+    manifest = Manifest.load(etl_dir(data_dir) / "manifest.json")
+    reports = [build_medals(manifest, data_dir, force=force)]
+    countries_digest = file_digest(data_dir / COUNTRIES_FILENAME)
+
+    # Every indicator is filtered to the Olympic countries and keyed by their ids, so each one depends
+    # on countries.csv too
+    stale = []
+    for spec in (SOURCES[name] for name in (names or SOURCES)):
+        inputs = {"raw": file_digest(spec.raw_path), "countries": countries_digest}
+        output = data_dir / spec.dataset.filename
+        if not force and output.exists() and manifest.is_fresh(spec.name, repr(spec), inputs):
+            reports.append({"source": spec.name, "output": spec.dataset.filename, "rebuilt": False})
+        else:
+            stale.append((spec, inputs))
+
+    if stale:
+        names = CountryDimension.load(data_dir / COUNTRIES_FILENAME).names
+        country_ids = {name: country_id for country_id, name in names.items()}
+        with ProcessPoolExecutor(max_workers=workers or min(len(stale), os.cpu_count() or 1)) as pool:
+            futures = [
+                pool.submit(clean_source, spec, inputs["raw"], country_ids, data_dir)
+                for spec, inputs in stale
+            ]
+            for (spec, inputs), future in zip(stale, futures):
+                reports.append(future.result())
+                manifest.record(spec.name, repr(spec), inputs)
+
+    derived = rebuild_derived(manifest, data_dir, force=force)
+    manifest.save()
+    return reports, derived
+
+
+def _print_report(reports: List[dict], derived: List[str], seconds: float):
+    for report in reports:
+        if not report["rebuilt"]:
+            print(f"⏭️ {report['output']}: inputs unchanged")
+            continue
+        print(f"✅ {report['output']}: {report['rows']} rows in {report['seconds']:.2f}s")
+        if report["missing"]:
+            print(f"⚠️ Unmatched countries in {report['source']}: {report['missing']}")
+    if derived:
+        print(f"✅ Rebuilt {', '.join(derived)}")
+    rebuilt = sum(report["rebuilt"] for report in reports)
+    print(f"✅ {rebuilt} of {len(reports)} sources rebuilt in {seconds:.2f}s")
+
+
+# python -m app.etl [source ...] [--workers N]
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m app.etl", description="Rebuild processed/ from RAW/")
+    parser.add_argument("sources", nargs="*", help=f"Sources to rebuild (default: all of {', '.join(SOURCES)})")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per source, up to the CPU count)")
+    parser.add_argument("--force", action="store_true", help="Rebuild every output even if its inputs are unchanged")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.sources if name not in SOURCES]
+    if unknown:
+        parser.error(f"unknown sources {unknown}")
+
+    started = time.perf_counter()
+    try:
+        reports, derived = run_pipeline(args.sources or None, workers=args.workers, force=args.force)
+    except MedalSchemaError as error:
+        raise SystemExit(f"❌ Medal tables rejected, nothing written: {error}")
+    _print_report(reports, derived, time.perf_counter() - started)
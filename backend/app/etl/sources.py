@@ -0,0 +1,55 @@
+# app/etl/sources.py
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.store import DATASET_SPECS, DatasetSpec
+
+RAW_DIR = Path(__file__).resolve().parents[1] / "data" / "RAW"
+SOCIO_ECONOMIC_DIR = RAW_DIR / "socio-economic"
+
+# Years kept from every indicator source
+YEAR_RANGE = (2000, 2023)
+
+
+# One raw indicator file and how to turn it into the processed dataset of the same name.
+# layout: "databank" - World Bank DataBank export, one row per country and "2000 [YR2000]" year columns
+#         "wdi"      - World Development Indicators download, 4 preamble lines and plain "2000" year columns
+#         "wgi"      - Worldwide Governance Indicators workbook, long format filtered to one indicator
+@dataclass(frozen=True)
+class SourceSpec:
+    name: str
+    raw_file: str
+    layout: str = "databank"
+    wgi_indicator: str = ""
+    # Rows without a value are kept as blank cells unless this is set
+    dropna: bool = False
+    sort: bool = True
+
+    @property
+    def raw_path(self) -> Path:
+        return SOCIO_ECONOMIC_DIR / self.raw_file
+
+    @property
+    def dataset(self) -> DatasetSpec:
+        return DATASET_SPECS[self.name]
+
+    @property
+    def value_column(self) -> str:
+        return self.dataset.value_columns[0]
+
+
+SOURCES = {
+    spec.name: spec
+    for spec in [
+        SourceSpec("gdp", "GDP_Data.csv"),
+        SourceSpec("gdp_per_capita", "gdp_per_capita.csv", layout="wdi"),
+        SourceSpec("education_exp", "education_expenditure.csv"),
+        SourceSpec("health_exp", "health_expenditure.csv"),
+        SourceSpec("life_expectancy", "life_expectancy.csv"),
+        SourceSpec("literacy_rate", "literacy_rate.csv"),
+        # WGI rows without an estimate are dropped and the workbook's (year, country) order is kept
+        SourceSpec("political_stability", "wgi_full.xlsx", layout="wgi", wgi_indicator="pv", dropna=True, sort=False),
+        SourceSpec("population", "population_total.csv"),
+        SourceSpec("urban_population", "urban_population_percent.csv"),
+    ]
+}
@@ -0,0 +1,88 @@
+# app/etl/wgi.py
+#
+# Worldwide Governance Indicators workbook (RAW/socio-economic/wgi_full.xlsx): one row per
+# (country, year, indicator). The sheet is streamed row by row in read-only mode instead of loading
+# the whole workbook into a frame, and the six indicators are cached as one columnar extract so
+# later runs, and new governance factors, never open the xlsx again.
+import shutil
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.columnar import read_columnar, write_columnar
+from app.etl.manifest import file_digest
+
+WGI_INDICATORS = {
+    "va": "Voice and Accountability",
+    "pv": "Political Stability and Absence of Violence/Terrorism",
+    "ge": "Government Effectiveness",
+    "rq": "Regulatory Quality",
+    "rl": "Rule of Law",
+    "cc": "Control of Corruption",
+}
+WGI_COLUMNS = ("countryname", "code", "year", "indicator", "estimate")
+# Marker the workbook uses for a missing estimate
+MISSING = ".."
+
+
+def _estimate(value) -> float:
+    if value is None or value == MISSING:
+        return np.nan
+    return float(value)
+
+
+# Stream the sheet and keep only rows of the given indicators
+def stream_wgi(path: Path, indicators: Iterable[str] = tuple(WGI_INDICATORS)) -> pd.DataFrame:
+    from openpyxl import load_workbook
+
+    wanted = set(indicators)
+    data = {column: [] for column in WGI_COLUMNS}
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows)
+        positions = [header.index(column) for column in WGI_COLUMNS]
+        indicator_at = header.index("indicator")
+        for row in rows:
+            if row[indicator_at] not in wanted:
+                continue
+            for column, position in zip(WGI_COLUMNS, positions):
+                data[column].append(row[position])
+    finally:
+        workbook.close()
+
+    return pd.DataFrame({
+        "countryname": pd.Series(data["countryname"], dtype="category"),
+        "code": pd.Series(data["code"], dtype="category"),
+        "year": np.asarray(data["year"], dtype="int16"),
+        "indicator": pd.Series(data["indicator"], dtype="category"),
+        "estimate": np.array([_estimate(value) for value in data["estimate"]], dtype="float64"),
+    })
+
+
+# Every indicator's estimates, parsed from the workbook only when its content changed
+def load_wgi(path: Path, cache_root: Path, digest: Optional[str] = None) -> pd.DataFrame:
+    name = f"wgi-{digest or file_digest(path)}"
+    extract = read_columnar(name, root=cache_root)
+    if extract is None:
+        extract = stream_wgi(path)
+        write_columnar(name, extract, root=cache_root)
+        for old in cache_root.glob("wgi-*"):
+            if old.name != name:
+                shutil.rmtree(old, ignore_errors=True)
+    return extract
+
+
+# (Country, Year, value) rows of one indicator
+def wgi_indicator(path: Path, indicator: str, value_column: str, cache_root: Path, digest: Optional[str] = None) -> pd.DataFrame:
+    if indicator not in WGI_INDICATORS:
+        raise ValueError(f"Unknown WGI indicator {indicator!r}, choose from {list(WGI_INDICATORS)}")
+    wgi = load_wgi(path, cache_root, digest)
+    rows = wgi[wgi["indicator"] == indicator]
+    return pd.DataFrame({
+        "Country": rows["countryname"].astype("str").to_numpy(),
+        "Year": rows["year"].astype("int64").to_numpy(),
+        value_column: rows["estimate"].to_numpy(),
+    })
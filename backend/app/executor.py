@@ -0,0 +1,105 @@
+# app/executor.py
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException
+
+from app.metrics import timed
+
+
+# Bounded pool for CPU-heavy jobs (scikit-learn) so they never run on the event loop
+class ComputeExecutor:
+    def __init__(self, max_workers: int = 2, max_pending: int = 16, timeout: float = 30.0, kind: str = "thread"):
+        if kind not in ("thread", "process"):
+            raise ValueError("kind must be 'thread' or 'process'")
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.kind = kind
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+        # Jobs queued or running; a job that timed out keeps its slot until it really finishes
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    @classmethod
+    def from_env(cls) -> "ComputeExecutor":
+        return cls(
+            max_workers=int(os.environ.get("OLYMPIQ_COMPUTE_WORKERS", min(4, os.cpu_count() or 1))),
+            max_pending=int(os.environ.get("OLYMPIQ_COMPUTE_MAX_PENDING", 16)),
+            timeout=float(os.environ.get("OLYMPIQ_COMPUTE_TIMEOUT", 30)),
+            kind=os.environ.get("OLYMPIQ_COMPUTE_BACKEND", "thread"),
+        )
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    if self.kind == "process":
+                        self._pool = ProcessPoolExecutor(
+                            max_workers=self.max_workers,
+                            mp_context=multiprocessing.get_context("spawn"),
+                        )
+                    else:
+                        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="compute")
+        return self._pool
+
+    def _release(self, future):
+        with self._lock:
+            self._pending -= 1
+            if not future.cancelled():
+                self.completed += 1
+
+    # Run fn(*args, **kwargs) in the pool; 503 when the queue is full, 504 when it takes too long
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise HTTPException(status_code=503, detail="Compute queue is full, try again shortly")
+            self._pending += 1
+
+        try:
+            future = self._get_pool().submit(partial(fn, *args, **kwargs))
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(self._release)
+
+        try:
+            # Cancelling the wrapper also cancels the job if it has not started yet
+            with timed("compute"):
+                return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.timed_out += 1
+            raise HTTPException(status_code=504, detail=f"Computation exceeded {self.timeout:g}s")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "timeout": self.timeout,
+                "pending": self._pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+            }
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+compute_executor = ComputeExecutor.from_env()
@@ -0,0 +1,41 @@
+# app/features.py
+import pandas as pd
+from fastapi import HTTPException
+
+from app.store import IndicatorStore
+
+FEATURE_COLUMNS = ["population", "psi", "medals"]
+
+
+# Rows posted by the client ({country, population, psi, medals} models) as a frame
+def rows_to_frame(rows) -> pd.DataFrame:
+    return pd.DataFrame([row.dict() for row in rows], columns=["country", *FEATURE_COLUMNS])
+
+
+# Per-country means used to fill years with no observation, by country id
+def _country_means(store: IndicatorStore) -> pd.DataFrame:
+    return store.frame("panel").groupby("country_id")[["population", "political_stability"]].mean()
+
+
+# (country, population, psi, medals) for one year: the input of clustering and PCA.
+# Countries are those with population data; a missing population or PSI value falls back to the
+# country's mean over all years, then 0; medals are the year's medal total, 0 when the country did not medal.
+# A year with no panel rows at all is a 404 rather than a matrix made up of means.
+def build_feature_matrix(store: IndicatorStore, year: int) -> pd.DataFrame:
+    year_rows = store["panel"].by_year(year)
+    if year_rows.empty:
+        raise HTTPException(status_code=404, detail=f"No data for year {year}")
+    means = store.derived("feature_means", _country_means)
+    country_ids = means.index[means["population"].notna()]
+
+    year_rows = year_rows.set_index("country_id").reindex(country_ids)
+
+    matrix = pd.DataFrame({
+        "population": year_rows["population"].fillna(means["population"].reindex(country_ids)),
+        "psi": year_rows["political_stability"].fillna(means["political_stability"].reindex(country_ids)),
+        "medals": year_rows["total"],
+    }, index=country_ids).fillna(0)
+    matrix["medals"] = matrix["medals"].astype("int64")
+    matrix.insert(0, "country", country_ids.map(store.countries.names))
+    # Ordered by name like the client-built matrix
+    return matrix.sort_values("country", ignore_index=True)
@@ -1,11 +1,50 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from app.routes import router as api_router
-from app.dimensionality_reduction import router as dr_router
-from app.clusteranalysis import router as cluster_router
+import threading
+from contextlib import asynccontextmanager
+from app.startup import WARMUP, startup_timings  # first, so it can time the imports below
 
+with startup_timings.phase("fastapi", "import"):
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+with startup_timings.phase("app.routes", "import"):
+    from app.routes import router as api_router
+with startup_timings.phase("app.dimensionality_reduction", "import"):
+    from app.dimensionality_reduction import router as dr_router
+with startup_timings.phase("app.clusteranalysis", "import"):
+    from app.clusteranalysis import router as cluster_router
+from app.executor import compute_executor
+from app.metrics import MetricsMiddleware, TimedJSONResponse, router as metrics_router
+from app.profiler import ProfilerMiddleware
+from app.reload import StoreSnapshotMiddleware, store_reloader, warm_up
+from app.store import get_store
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load every processed dataset before the first request
+    store = get_store()
+    for step, seconds in store.load_seconds.items():
+        startup_timings.record(step, "load", seconds)
+    # Correlation table, medal aggregates and the scipy / scikit-learn imports (see OLYMPIQ_WARMUP)
+    if WARMUP == "startup":
+        warm_up(store)
+    elif WARMUP == "background":
+        threading.Thread(target=warm_up, args=(store,), name="warm-up", daemon=True).start()
+    # Watch the processed files when OLYMPIQ_RELOAD_INTERVAL is set
+    store_reloader.start()
+    startup_timings.mark_ready()
+    startup_timings.log()
+    yield
+    store_reloader.stop()
+    compute_executor.shutdown()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=TimedJSONResponse)
+
+app.add_middleware(StoreSnapshotMiddleware)
+# Per-route timings, bytes and cache outcomes: Server-Timing headers and GET /metrics
+app.add_middleware(MetricsMiddleware)
+# Feeds POST /api/admin/profile/requests; a pass-through while no request profile is armed
+app.add_middleware(ProfilerMiddleware)
 
 # Add CORS settings
 app.add_middleware(
@@ -14,8 +53,10 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Data-Version", "Server-Timing"],
 )
 
+app.include_router(metrics_router)
 app.include_router(api_router, prefix="/api")
 app.include_router(cluster_router, prefix="/api/clusteranalysis")
-app.include_router(dr_router, prefix="/api/dimensionality-reduction")
\ No newline at end of file
+app.include_router(dr_router, prefix="/api/dimensionality-reduction")
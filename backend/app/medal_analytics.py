@@ -0,0 +1,113 @@
+# app/medal_analytics.py
+#
+# Medal-table aggregates computed once per store instead of on every request: all-time totals per
+# team, per-Games rankings, per-country milestones and per-Games totals. Rankings follow the usual
+# tie rules: "rank" is the competition rank (1, 2, 2, 4), "dense_rank" skips no places (1, 2, 2, 3).
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from app.cache import Payload
+from app.store import IndicatorStore, get_store, to_records
+
+COUNT_COLUMNS = ["Gold", "Silver", "Bronze", "Total"]
+# Ranking orders: by total medals, or the medal-table order (golds, then silvers, then bronzes)
+RANKINGS = ("total", "gold")
+
+
+# One number per row that sorts like the ranking order; counts per team and Games stay far below 1000
+def _ranking_key(frame: pd.DataFrame, by: str) -> pd.Series:
+    if by == "total":
+        return frame["Total"].astype("int64")
+    return frame["Gold"].astype("int64") * 1_000_000 + frame["Silver"].astype("int64") * 1_000 + frame["Bronze"]
+
+
+# Rows of every Games ranked by one order, best first; ties are listed by team name
+def rank_medals(medals: pd.DataFrame, by: str) -> pd.DataFrame:
+    ranked = medals.drop(columns="country_id").assign(_key=_ranking_key(medals, by))
+    ranked = ranked.sort_values(["Year", "_key", "Country"], ascending=[True, False, True], kind="stable")
+    by_year = ranked.groupby("Year", sort=False)["_key"]
+    ranked["rank"] = by_year.rank(method="min", ascending=False).astype("int16")
+    ranked["dense_rank"] = by_year.rank(method="dense", ascending=False).astype("int16")
+    return ranked.drop(columns="_key").reset_index(drop=True)
+
+
+# Per canonical country: all-time counts, Games with a medal, first medal, best rank and most medals.
+# Teams that competed under another name (ROC, ...) count for their country, as in /medals/{country};
+# ties go to the earliest Games.
+def country_stats(medals: pd.DataFrame, countries) -> pd.DataFrame:
+    per_games = medals.groupby(["country_id", "Year"], as_index=False)[COUNT_COLUMNS].sum()
+    per_games["rank"] = per_games.groupby("Year")["Total"].rank(method="min", ascending=False).astype("int16")
+    grouped = per_games.groupby("country_id")
+    stats = grouped[COUNT_COLUMNS].sum()
+    stats["games"] = grouped.size()
+    stats["first_medal_year"] = per_games[per_games["Total"] > 0].groupby("country_id")["Year"].min()
+    # Rows are sorted by Year within a country, so idxmin / idxmax pick the earliest Games on ties
+    best = per_games.loc[grouped["rank"].idxmin(), ["country_id", "Year", "rank"]].set_index("country_id")
+    stats["best_year"] = best["Year"]
+    stats["best_rank"] = best["rank"]
+    highest = per_games.loc[grouped["Total"].idxmax(), ["country_id", "Year", "Total"]].set_index("country_id")
+    stats["highest_medal_year"] = highest["Year"]
+    stats["highest_medal_total"] = highest["Total"]
+    stats = stats.reset_index()
+    stats.insert(1, "Country", [countries.name(country_id) for country_id in stats["country_id"].tolist()])
+    return stats.sort_values(["Total", "Country"], ascending=[False, True], ignore_index=True)
+
+
+# Per Games: medals awarded, teams with a medal and the average haul of those teams
+def games_totals(medals: pd.DataFrame) -> pd.DataFrame:
+    grouped = medals.groupby("Year")
+    totals = grouped[COUNT_COLUMNS].sum()
+    totals["countries"] = grouped.size()
+    totals["average_medals"] = (totals["Total"] / totals["countries"]).round(2)
+    return totals.reset_index()
+
+
+class MedalAnalytics:
+    def __init__(self, store):
+        medals = store.frame("medals")
+        # Ties by name (as country_stats), so the order is stable across builds
+        self.aggregate = Payload.from_obj(to_records(
+            medals.groupby("Country", observed=True)[COUNT_COLUMNS].sum().reset_index()
+            .sort_values(["Total", "Country"], ascending=[False, True], ignore_index=True)
+        )).precompressed()
+
+        # Year -> ranked records, and the same rows without rank columns for /medals/top/{year}
+        self._rankings: Dict[str, Dict[int, List[dict]]] = {}
+        for by in RANKINGS:
+            ranked = rank_medals(medals, by)
+            self._rankings[by] = {int(year): to_records(rows) for year, rows in ranked.groupby("Year")}
+        self._top: Dict[int, List[dict]] = {
+            year: [{key: value for key, value in record.items() if key not in ("rank", "dense_rank")} for record in records]
+            for year, records in self._rankings["total"].items()
+        }
+
+        self.stats = country_stats(medals, store.countries)
+        records = to_records(self.stats)
+        self._stats_by_id = dict(zip(self.stats["country_id"].tolist(), records))
+        self.stats_payload = Payload.from_obj(records).precompressed()
+
+        games = games_totals(medals)
+        first = medals[medals["Total"] > 0].sort_values(["Year", "Country"], kind="stable").iloc[0]
+        highest = games.loc[games["Total"].idxmax()]
+        self.summary = Payload.from_obj({
+            "first_medal": {"Country": str(first["Country"]), "Year": int(first["Year"])},
+            "highest_medal_year": {"Year": int(highest["Year"]), "Total": int(highest["Total"])},
+            "games": to_records(games),
+        }).precompressed()
+
+    def ranking(self, year: int, by: str = "total", top_n: Optional[int] = None) -> Optional[List[dict]]:
+        records = self._rankings[by].get(year)
+        return records if records is None or top_n is None else records[:top_n]
+
+    def top(self, year: int, top_n: int) -> Optional[List[dict]]:
+        records = self._top.get(year)
+        return None if records is None else records[:top_n]
+
+    def country(self, country_id: int) -> Optional[dict]:
+        return self._stats_by_id.get(country_id)
+
+
+# Built once per store; pass a store to build it for one that is not published yet
+def get_medal_analytics(store: Optional[IndicatorStore] = None) -> MedalAnalytics:
+    return (store or get_store()).derived("medal_analytics", MedalAnalytics)
@@ -0,0 +1,239 @@
+# app/metrics.py
+#
+# Per-route request metrics. MetricsMiddleware times every request; inside it, the shared helpers that
+# every handler goes through report where the time went:
+#   filter       row selection (Dataset.select / by_year / by_country, ...)
+#   materialize  frame -> Python objects (to_records / to_columns)
+#   serialize    objects -> JSON bytes (dumps, the JSON responses)
+#   compute      clustering / PCA jobs in the compute pool
+# and whether the body came from a cache. Each response carries the breakdown in a Server-Timing
+# header, and GET /metrics serves the per-route totals in the Prometheus text format. Metrics are per
+# process: with several uvicorn workers, each scrape sees the worker that answered it.
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse, PlainTextResponse
+from starlette.datastructures import MutableHeaders
+
+PHASES = ("filter", "materialize", "serialize", "compute")
+# Request duration histogram buckets, in seconds
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# Set to 0 to leave the Server-Timing header out of responses
+SERVER_TIMING = os.environ.get("OLYMPIQ_SERVER_TIMING", "1") != "0"
+
+
+# Phases and cache outcome of the request being handled
+class RequestTimings:
+    __slots__ = ("phases", "cache")
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.cache: Optional[str] = None
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+# Add the time spent in the block to a phase of the current request; a no-op outside requests
+# (data loading, warm-up)
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.phases[phase] = timings.phases.get(phase, 0.0) + time.perf_counter() - start
+
+
+# "hit" (a cached body or result was served), "miss" (it was built for this request) or "not_modified";
+# replace=False keeps an outcome already recorded for the request
+def record_cache(result: str, replace: bool = True):
+    timings = _current.get()
+    if timings is not None and (replace or timings.cache is None):
+        timings.cache = result
+
+
+class _RouteMetrics:
+    __slots__ = ("statuses", "buckets", "duration", "phases", "bytes", "cache")
+
+    def __init__(self):
+        self.statuses: Dict[int, int] = {}
+        self.buckets: List[int] = [0] * len(BUCKETS)
+        self.duration = 0.0
+        self.phases: Dict[str, float] = {phase: 0.0 for phase in PHASES}
+        self.bytes = 0
+        self.cache: Dict[str, int] = {}
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._routes: Dict[Tuple[str, str], _RouteMetrics] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, method: str, route: str, status: int, seconds: float, body_bytes: int, timings: RequestTimings):
+        with self._lock:
+            metrics = self._routes.get((method, route))
+            if metrics is None:
+                metrics = self._routes[(method, route)] = _RouteMetrics()
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            for index, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    metrics.buckets[index] += 1
+            metrics.duration += seconds
+            for phase, spent in timings.phases.items():
+                metrics.phases[phase] = metrics.phases.get(phase, 0.0) + spent
+            metrics.bytes += body_bytes
+            if timings.cache is not None:
+                metrics.cache[timings.cache] = metrics.cache.get(timings.cache, 0) + 1
+
+    # Prometheus text exposition format (version 0.0.4)
+    def render(self) -> str:
+        from app.executor import compute_executor
+        from app.results_cache import results_cache
+
+        with self._lock:
+            routes = sorted(self._routes.items())
+            lines = [
+                "# HELP olympiq_requests_total Requests handled, by route and status.",
+                "# TYPE olympiq_requests_total counter",
+            ]
+            for (method, route), metrics in routes:
+                for status, count in sorted(metrics.statuses.items()):
+                    lines.append(f'olympiq_requests_total{{method="{method}",route="{route}",status="{status}"}} {count}')
+
+            lines += [
+                "# HELP olympiq_request_duration_seconds Time from the request to the last body byte.",
+                "# TYPE olympiq_request_duration_seconds histogram",
+            ]
+            for (method, route), metrics in routes:
+                labels = f'method="{method}",route="{route}"'
+                for bound, count in zip(BUCKETS, metrics.buckets):
+                    lines.append(f'olympiq_request_duration_seconds_bucket{{{labels},le="{bound:g}"}} {count}')
+                total = sum(metrics.statuses.values())
+                lines.append(f'olympiq_request_duration_seconds_bucket{{{labels},le="+Inf"}} {total}')
+                lines.append(f"olympiq_request_duration_seconds_sum{{{labels}}} {metrics.duration:.6f}")
+                lines.append(f"olympiq_request_duration_seconds_count{{{labels}}} {total}")
+
+            lines += [
+                "# HELP olympiq_request_phase_seconds_total Time spent per phase (filter, materialize, serialize, compute).",
+                "# TYPE olympiq_request_phase_seconds_total counter",
+            ]
+            for (method, route), metrics in routes:
+                for phase, spent in metrics.phases.items():
+                    lines.append(f'olympiq_request_phase_seconds_total{{method="{method}",route="{route}",phase="{phase}"}} {spent:.6f}')
+
+            lines += [
+                "# HELP olympiq_response_bytes_total Response body bytes sent, after compression.",
+                "# TYPE olympiq_response_bytes_total counter",
+            ]
+            for (method, route), metrics in routes:
+                lines.append(f'olympiq_response_bytes_total{{method="{method}",route="{route}"}} {metrics.bytes}')
+
+            lines += [
+                "# HELP olympiq_cache_requests_total Requests served from a cached body or result, built anew, or answered 304.",
+                "# TYPE olympiq_cache_requests_total counter",
+            ]
+            for (method, route), metrics in routes:
+                for result, count in sorted(metrics.cache.items()):
+                    lines.append(f'olympiq_cache_requests_total{{method="{method}",route="{route}",result="{result}"}} {count}')
+
+        cache = results_cache.stats()
+        compute = compute_executor.stats()
+        lines += [
+            "# HELP olympiq_results_cache_entries Clustering / PCA results held.",
+            "# TYPE olympiq_results_cache_entries gauge",
+            f"olympiq_results_cache_entries {cache['size']}",
+            "# HELP olympiq_compute_pending Compute jobs queued or running.",
+            "# TYPE olympiq_compute_pending gauge",
+            f"olympiq_compute_pending {compute['pending']}",
+            "# HELP olympiq_compute_rejected_total Compute jobs rejected with 503.",
+            "# TYPE olympiq_compute_rejected_total counter",
+            f"olympiq_compute_rejected_total {compute['rejected']}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+
+# Route template of a matched request, with the mount prefix ("/api/medals/{country}"); requests that
+# matched no route share one label so unknown URLs cannot grow the registry
+def route_template(scope) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path is None:
+        return "unmatched"
+    concrete = path
+    for name, value in scope.get("path_params", {}).items():
+        concrete = concrete.replace("{" + name + "}", str(value))
+    if scope["path"].endswith(concrete):
+        return scope["path"][: len(scope["path"]) - len(concrete)] + path
+    return path
+
+
+def server_timing(timings: RequestTimings, total: float) -> str:
+    entries = [f"{phase};dur={spent * 1000:.3f}" for phase, spent in timings.phases.items()]
+    entries.append(f"app;dur={total * 1000:.3f}")
+    if timings.cache is not None:
+        entries.append(f'cache;desc="{timings.cache}"')
+    return ", ".join(entries)
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timings = RequestTimings()
+        token = _current.set(timings)
+        started = time.perf_counter()
+        status = 500
+        body_bytes = 0
+
+        async def send_with_timing(message):
+            nonlocal status, body_bytes
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if SERVER_TIMING:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", server_timing(timings, time.perf_counter() - started))
+                    # Lets the dashboard (another origin) read the header through the Performance API
+                    headers.append("Timing-Allow-Origin", "*")
+            elif message["type"] == "http.response.body":
+                body_bytes += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            metrics_registry.observe(
+                scope["method"], route_template(scope), status, time.perf_counter() - started, body_bytes, timings
+            )
+
+
+# JSON responses of the handlers that return Python objects, with their encoding timed
+class TimedJSONResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        with timed("serialize"):
+            return super().render(content)
+
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics():
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,86 @@
+# app/panel.py
+#
+# One wide table with a row per (country id, year) and a float64 column per indicator, built from
+# the processed datasets:
+#
+#   country_id, Year, gold, silver, bronze, total, gdp, gdp_per_capita, ..., urban_population
+#
+# Rows are ordered by canonical country name, then year.
+# Medal columns are null where the medal table has no entry for that country and year, indicator
+# columns are null where the source has no value.
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from app.countries import COUNTRIES_FILENAME, CountryDimension
+
+# Panel column -> (dataset, column in that dataset)
+PANEL_COLUMNS = {
+    "gold": ("medals", "Gold"),
+    "silver": ("medals", "Silver"),
+    "bronze": ("medals", "Bronze"),
+    "total": ("medals", "Total"),
+    "gdp": ("gdp", "GDP (total)"),
+    "gdp_per_capita": ("gdp_per_capita", "GDP per capita"),
+    "education_exp": ("education_exp", "Education Exp (%GDP)"),
+    "health_exp": ("health_exp", "Health Exp (%GDP)"),
+    "life_expectancy": ("life_expectancy", "Life Expectancy"),
+    "literacy_rate": ("literacy_rate", "Literacy Rate (% 15+)"),
+    "political_stability": ("political_stability", "Political Stability Index"),
+    "population": ("population", "Population"),
+    "urban_population": ("urban_population", "Urban Population (%)"),
+}
+PANEL_FILENAME = "panel.csv"
+
+
+# One dataset's columns keyed by (country id, year)
+def _keyed(frame: pd.DataFrame, columns: Dict[str, str], sum_duplicates: bool) -> pd.DataFrame:
+    keyed = frame[["country_id", "Year", *columns.values()]].rename(columns={v: k for k, v in columns.items()})
+    keyed = keyed.astype({column: "float64" for column in columns})
+    grouped = keyed.groupby(["country_id", "Year"], sort=False)
+    # Medal rows of teams that share a country id (ROC and Russia, ...) add up
+    return grouped.sum(min_count=1) if sum_duplicates else grouped.first()
+
+
+# Outer-join every dataset in PANEL_COLUMNS on (country id, year)
+def build_panel(frames: Dict[str, pd.DataFrame], countries: CountryDimension) -> pd.DataFrame:
+    by_dataset: Dict[str, Dict[str, str]] = {}
+    for column, (dataset, source_column) in PANEL_COLUMNS.items():
+        by_dataset.setdefault(dataset, {})[column] = source_column
+
+    parts = [
+        _keyed(frames[dataset], columns, sum_duplicates=dataset == "medals")
+        for dataset, columns in by_dataset.items()
+    ]
+    panel = pd.concat(parts, axis=1, join="outer").reset_index()
+    names = panel["country_id"].map(countries.names)
+    panel = panel.iloc[np.lexsort((panel["Year"].to_numpy(), names.to_numpy()))].reset_index(drop=True)
+    panel = panel[["country_id", "Year", *PANEL_COLUMNS]]
+    panel["country_id"] = panel["country_id"].astype("int16")
+    panel["Year"] = panel["Year"].astype("int16")
+    return panel
+
+
+# Rebuild processed/panel.csv from the other processed datasets
+def write_panel(data_dir=None):
+    from app.etl.pipeline import write_csv_atomic
+    from app.store import DATA_DIR, DATASET_SPECS, load_frame
+
+    data_dir = data_dir or DATA_DIR
+    datasets = {dataset for dataset, _ in PANEL_COLUMNS.values()}
+    frames = {name: load_frame(DATASET_SPECS[name], data_dir) for name in datasets}
+    panel = build_panel(frames, CountryDimension.load(data_dir / COUNTRIES_FILENAME))
+    # Replaced in one rename, so an interrupted run or a reload never reads a half-written panel
+    write_csv_atomic(panel, data_dir / PANEL_FILENAME)
+    return panel
+
+
+# python -m app.panel
+def main():
+    panel = write_panel()
+    print(f"✅ {len(panel)} rows x {len(PANEL_COLUMNS)} indicators -> {PANEL_FILENAME}")
+
+
+if __name__ == "__main__":
+    main()
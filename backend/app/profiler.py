@@ -0,0 +1,224 @@
+# app/profiler.py
+#
+# On-demand sampling profiler for a running worker (POST /api/admin/profile...). A sampler thread reads
+# the Python stack of every thread (sys._current_frames) at a fixed interval and counts identical
+# stacks. Profiles are returned as collapsed stacks, one "thread;frame;...;frame count" line per stack,
+# which flamegraph.pl, inferno and speedscope read as is. Nothing runs while no profile is being taken:
+# the sampler thread only exists during a profile and ProfilerMiddleware checks a single attribute.
+import asyncio
+import os
+import re
+import sys
+import sysconfig
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+# Leaf frames of threads that are waiting for work (event loop select, idle pool workers, Event.wait);
+# their samples are left out unless idle stacks are asked for
+IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+}
+_SITE_PACKAGES = re.compile(r".*[/\\](?:site|dist)-packages[/\\]")
+# Prefixes left out of frame paths: the backend directory and the standard library
+_PATH_PREFIXES = (
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep,
+    sysconfig.get_paths()["stdlib"] + os.sep,
+)
+
+
+class ProfilerBusy(Exception):
+    pass
+
+
+# "function (path:first line)": grouped per function rather than per line, so a flamegraph shows one
+# box per call; paths are relative to the backend directory, the standard library or site-packages
+def _frame_label(code, cache: Dict[object, str]) -> str:
+    label = cache.get(code)
+    if label is None:
+        path = _SITE_PACKAGES.sub("", code.co_filename)
+        for prefix in _PATH_PREFIXES:
+            if path.startswith(prefix):
+                path = path[len(prefix):]
+                break
+        label = cache[code] = f"{code.co_qualname} ({path}:{code.co_firstlineno})".replace(";", ":")
+    return label
+
+
+class Sampler:
+    def __init__(self, interval: float = 0.01, include_idle: bool = False):
+        self.interval = interval
+        self.include_idle = include_idle
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.sampled_seconds = 0.0
+        self._labels: Dict[object, str] = {}
+        # Cleared while paused (between the requests of a request profile)
+        self._active = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self, own_ident: int):
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            code = frame.f_code
+            if not self.include_idle and (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code, self._labels))
+                frame = frame.f_back
+            stack.append(names.get(ident, f"thread-{ident}"))
+            self.stacks[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        while not self._stop.is_set():
+            if not self._active.wait(0.05):
+                continue
+            started = time.perf_counter()
+            self._sample(own_ident)
+            self._stop.wait(self.interval)
+            self.sampled_seconds += time.perf_counter() - started
+
+    def start(self, active: bool = True):
+        if active:
+            self._active.set()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+
+    def resume(self):
+        self._active.set()
+
+    def pause(self):
+        self._active.clear()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+
+# "/api/medals/{country}" -> a regex matching the concrete paths of that route
+def _route_pattern(route: str) -> "re.Pattern":
+    pattern = ""
+    for part in re.split(r"(\{[^}]+\})", route):
+        if part.startswith("{"):
+            pattern += ".+" if part.endswith(":path}") else "[^/]+"
+        else:
+            pattern += re.escape(part)
+    return re.compile(pattern + "$")
+
+
+# Samples taken while one of the next `count` requests to a route is running. Everything the worker
+# does meanwhile is sampled, so requests to other routes running at the same time show up as well.
+class RequestProfile:
+    def __init__(self, route: str, method: Optional[str], count: int, sampler: Sampler):
+        self.route = route
+        self.method = method.upper() if method else None
+        self.pattern = _route_pattern(route)
+        self.remaining = count
+        self.profiled = 0
+        self.in_flight = 0
+        self.sampler = sampler
+        self.done = asyncio.Event()
+
+    def matches(self, scope) -> bool:
+        return (
+            self.remaining > 0
+            and (self.method is None or scope["method"] == self.method)
+            and self.pattern.match(scope["path"]) is not None
+        )
+
+    # Both run on the event loop, one request at a time, so the counters need no lock
+    def request_started(self):
+        self.remaining -= 1
+        self.in_flight += 1
+        self.sampler.resume()
+
+    def request_finished(self):
+        self.in_flight -= 1
+        self.profiled += 1
+        if self.in_flight == 0:
+            self.sampler.pause()
+        if self.remaining == 0 and self.in_flight == 0:
+            self.done.set()
+
+
+class Profiler:
+    def __init__(self):
+        # The request profile ProfilerMiddleware feeds, if any
+        self.armed: Optional[RequestProfile] = None
+        self._lock = threading.Lock()
+        self._busy = False
+
+    def _acquire(self):
+        with self._lock:
+            if self._busy:
+                raise ProfilerBusy("A profile is already being taken in this worker")
+            self._busy = True
+
+    def _release(self):
+        with self._lock:
+            self._busy = False
+
+    # Sample the whole worker for `seconds`
+    async def profile_for(self, seconds: float, interval: float, include_idle: bool) -> Sampler:
+        self._acquire()
+        sampler = Sampler(interval, include_idle)
+        try:
+            sampler.start()
+            await asyncio.sleep(seconds)
+        finally:
+            sampler.stop()
+            self._release()
+        return sampler
+
+    # Sample the next `count` requests to `route`; returns early with fewer requests after `timeout`
+    async def profile_requests(self, route: str, method: Optional[str], count: int, timeout: float,
+                               interval: float, include_idle: bool) -> Tuple[Sampler, int]:
+        self._acquire()
+        sampler = Sampler(interval, include_idle)
+        profile = RequestProfile(route, method, count, sampler)
+        try:
+            sampler.start(active=False)
+            self.armed = profile
+            try:
+                await asyncio.wait_for(profile.done.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        finally:
+            self.armed = None
+            sampler.stop()
+            self._release()
+        return sampler, profile.profiled
+
+
+profiler = Profiler()
+
+
+# Hands the requests a request profile asked for to it; a pass-through while none is armed
+class ProfilerMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        profile = profiler.armed
+        if profile is None or scope["type"] != "http" or not profile.matches(scope):
+            await self.app(scope, receive, send)
+            return
+        profile.request_started()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profile.request_finished()
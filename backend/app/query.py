@@ -0,0 +1,123 @@
+# app/query.py
+#
+# Query parameters shared by every list endpoint (/medals, /gdp, /population, ..., /panel):
+#
+#   fields=Gold,Total       value columns to return; Country and Year are always returned
+#   year_from=, year_to=    inclusive year range
+#   countries=IND&countries=Korea, Rep.
+#                           any name, alias, NOC or ISO3 code; repeat the parameter or comma-separate
+#   limit=, offset=         a page of the matching rows; X-Total-Count holds the number of matches
+#   format=columns          parallel arrays plus a country dictionary instead of one object per row
+#
+# Clients sending Accept: application/vnd.apache.arrow.stream get the same rows as an Arrow IPC
+# stream (app/arrow.py) instead of JSON, whatever the format parameter.
+#
+# Rows are found through the store's year and country indexes, so only what the chart draws is
+# serialized. A request without any of these parameters gets the pre-encoded full dataset.
+from dataclasses import dataclass
+from typing import List, Literal, Optional, Set, Tuple
+
+from fastapi import HTTPException, Query, Request, Response
+
+from app.arrow import ARROW_STREAM, arrow_available, to_arrow_stream, wants_arrow
+from app.cache import Payload, payload_response
+from app.countries import CountryDimension
+from app.metrics import record_cache, timed
+from app.store import Dataset, to_columns, to_records
+
+# Response layouts: one object per row, or parallel arrays (see store.to_columns)
+FORMATS = ("records", "columns")
+
+
+@dataclass(frozen=True)
+class ListQuery:
+    fields: Optional[Tuple[str, ...]] = None
+    year_from: Optional[int] = None
+    year_to: Optional[int] = None
+    countries: Optional[Tuple[str, ...]] = None
+    limit: Optional[int] = None
+    offset: int = 0
+    format: str = "records"
+
+    # True when every row and column is wanted, whatever the layout
+    def is_empty(self) -> bool:
+        return self == ListQuery(format=self.format)
+
+
+def _split(value: str) -> List[str]:
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+# FastAPI dependency: Depends(list_query)
+def list_query(
+    fields: Optional[str] = Query(None, description="Comma-separated value columns, e.g. Gold,Total"),
+    year_from: Optional[int] = Query(None, description="First year to include"),
+    year_to: Optional[int] = Query(None, description="Last year to include"),
+    countries: Optional[List[str]] = Query(None, description="Countries by name, alias, NOC or ISO3 code; repeatable or comma-separated"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of rows"),
+    offset: int = Query(0, ge=0, description="Rows to skip"),
+    format: Literal[FORMATS] = Query("records", description="records: one object per row; columns: parallel arrays"),
+) -> ListQuery:
+    return ListQuery(
+        fields=tuple(_split(fields)) if fields is not None else None,
+        year_from=year_from,
+        year_to=year_to,
+        countries=tuple(countries) if countries else None,
+        limit=limit,
+        offset=offset,
+        format=format,
+    )
+
+
+# Ids of the requested countries; a value that is not a known spelling as a whole is read as a
+# comma-separated list ("Korea, Rep." is one country, "IND,USA" two). Unknown countries match nothing.
+def resolve_countries(dimension: CountryDimension, values: Tuple[str, ...]) -> Set[int]:
+    ids = set()
+    for value in values:
+        country_id = dimension.resolve(value)
+        parts = [country_id] if country_id is not None else [dimension.resolve(part) for part in _split(value)]
+        ids.update(part for part in parts if part is not None)
+    return ids
+
+
+# Encoded rows of a dataset for one query, and the number of matching rows (None for the full dataset)
+def query_payload(dataset: Dataset, query: ListQuery, arrow: bool = False) -> Tuple[Payload, Optional[int]]:
+    if query.is_empty():
+        record_cache("hit")
+        if arrow:
+            return dataset.arrow_payload, None
+        return (dataset.columns_payload if query.format == "columns" else dataset.records_payload), None
+
+    if query.fields is not None:
+        unknown = [field for field in query.fields if field not in dataset.spec.value_columns and field not in dataset.key_columns]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields {unknown} for {dataset.name}. Choose from {list(dataset.spec.value_columns)}",
+            )
+
+    record_cache("miss")
+    country_ids = resolve_countries(dataset.countries, query.countries) if query.countries is not None else None
+    selected = dataset.select(query.fields, query.year_from, query.year_to, country_ids)
+    total = len(selected)
+    stop = None if query.limit is None else query.offset + query.limit
+    if query.offset or stop is not None:
+        selected = selected.iloc[query.offset:stop]
+
+    if arrow:
+        with timed("serialize"):
+            return Payload.from_bytes(to_arrow_stream(selected), media_type=ARROW_STREAM), total
+    encode = to_columns if query.format == "columns" else to_records
+    return Payload.from_obj(encode(selected)), total
+
+
+def list_response(request: Request, dataset: Dataset, query: ListQuery) -> Response:
+    arrow = wants_arrow(request.headers.get("accept"))
+    if arrow and not arrow_available():
+        raise HTTPException(status_code=406, detail=f"{ARROW_STREAM} needs pyarrow on the server")
+
+    payload, total = query_payload(dataset, query, arrow)
+    response = payload_response(request, payload, vary=["Accept"])
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
+    return response
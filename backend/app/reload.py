@@ -0,0 +1,144 @@
+# app/reload.py
+#
+# Publishing refreshed ETL output without restarting workers. A reload builds a complete new store
+# (frames, indexes, encoded payloads, correlation table, medal aggregates) off the event loop, then
+# swaps it in with one assignment. Each request pins the store it started with, so in-flight requests
+# finish on the old data and the old store is freed with its last request.
+import logging
+import os
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+
+from app.correlation import get_correlation_engine
+from app.medal_analytics import get_medal_analytics
+from app.startup import HEAVY_MODULES, StartupTimings, startup_timings, timed_import
+from app.store import DATA_DIR, IndicatorStore, data_version, get_store, publish_store, store_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+# Derived tables built for a store before it is published, so no request waits for them
+WARM_BUILDERS = (("correlation table", get_correlation_engine), ("medal analytics", get_medal_analytics))
+
+
+def warm_store(store: IndicatorStore, timings: Optional[StartupTimings] = None) -> IndicatorStore:
+    for name, build in WARM_BUILDERS:
+        with timings.phase(name, "warm") if timings else nullcontext():
+            build(store)
+    return store
+
+
+# Startup warm-up: the heavy modules first (so the tables are timed without them), then the tables
+def warm_up(store: IndicatorStore):
+    for module in HEAVY_MODULES:
+        timed_import(module)
+    warm_store(store, startup_timings)
+    startup_timings.mark_warmed()
+
+
+class StoreReloader:
+    def __init__(self, data_dir: Path = DATA_DIR, interval: float = 0.0):
+        self.data_dir = data_dir
+        # Seconds between checks of the processed files; 0 disables the watcher
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_reload: Optional[dict] = None
+        self.failed_version: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> "StoreReloader":
+        return cls(interval=float(os.environ.get("OLYMPIQ_RELOAD_INTERVAL", 0)))
+
+    # Load and publish the processed files when their version differs from the published store's.
+    # Blocking: call it from a thread. Concurrent calls are serialized, so a burst triggers one load.
+    def reload(self, force: bool = False) -> dict:
+        with self._lock:
+            current = get_store()
+            version = data_version(self.data_dir)
+            if version == current.version and not force:
+                return {"reloaded": False, "version": current.version}
+            started = time.perf_counter()
+            try:
+                store = warm_store(IndicatorStore.load(self.data_dir))
+            except Exception:
+                self.failed_version = version
+                raise
+            publish_store(store)
+            self.failed_version = None
+            self.last_reload = {
+                "reloaded": True,
+                "version": store.version,
+                "previous_version": current.version,
+                "seconds": round(time.perf_counter() - started, 3),
+                "at": time.time(),
+            }
+            logger.info("Data reloaded: %s -> %s in %.2fs", current.version, store.version, self.last_reload["seconds"])
+            return self.last_reload
+
+    # The ETL replaces files one by one, so a version is only loaded once it has been stable for a whole
+    # interval; a version that failed to load is not retried until the files change again
+    def _watch(self):
+        seen = None
+        while not self._stop.wait(self.interval):
+            try:
+                version = data_version(self.data_dir)
+                if version != seen:
+                    seen = version
+                    continue
+                if version != get_store().version and version != self.failed_version:
+                    self.reload()
+            except Exception:
+                logger.exception("Data reload failed; still serving version %s", get_store().version)
+
+    def start(self):
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="data-reload", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=self.interval + 1)
+
+    def status(self) -> dict:
+        return {
+            "version": get_store().version,
+            "files_version": data_version(self.data_dir),
+            "watch_interval": self.interval,
+            "last_reload": self.last_reload,
+            "failed_version": self.failed_version,
+        }
+
+
+# Pins the current store for each HTTP request (see store_snapshot), exposes its version to
+# payload_response for ETags and reports it in an X-Data-Version header
+class StoreSnapshotMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with store_snapshot() as store:
+            scope.setdefault("state", {})["data_version"] = store.version
+
+            async def send_with_version(message):
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append("X-Data-Version", store.version)
+                await send(message)
+
+            await self.app(scope, receive, send_with_version)
+
+
+store_reloader = StoreReloader.from_env()
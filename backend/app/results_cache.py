@@ -0,0 +1,69 @@
+# app/results_cache.py
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+import pandas as pd
+
+from app.metrics import record_cache
+
+
+# LRU cache for clustering / PCA results, keyed by the content of the input matrix plus parameters
+class ResultsCache:
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # Hash of the frame's values and column names, independent of the row index
+    @staticmethod
+    def fingerprint(frame: pd.DataFrame, **params) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr(list(frame.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+        digest.update(repr(sorted(params.items())).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                record_cache("hit")
+                return self._entries[key]
+            self.misses += 1
+            record_cache("miss")
+            return None
+
+    def put(self, key: str, value: Any):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Shared by /clusteranalysis and /dimensionality-reduction
+results_cache = ResultsCache(maxsize=int(os.environ.get("OLYMPIQ_RESULTS_CACHE_SIZE", 128)))
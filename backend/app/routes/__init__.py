@@ -8,9 +8,13 @@ from .urban_population_routes import router as urban_population_router
 from .population_routes import router as population_router
 from .health_exp_routes import router as health_exp_router
 from .life_expectancy_routes import router as life_exp_router
-""" from .literacy_routes import router as literacy_router
- """
+from .literacy_routes import router as literacy_router
 from .correlation_routes import router as correlation_router
+from .dataset_routes import router as dataset_router
+from .panel_routes import router as panel_router
+from .country_routes import router as country_router
+from .batch_routes import router as batch_router
+from .admin_routes import router as admin_router
 
 
 router = APIRouter()
@@ -23,6 +27,10 @@ router.include_router(urban_population_router)
 router.include_router(population_router)
 router.include_router(health_exp_router)
 router.include_router(life_exp_router)
-""" router.include_router(literacy_router)
- """
-router.include_router(correlation_router)
\ No newline at end of file
+router.include_router(literacy_router)
+router.include_router(correlation_router)
+router.include_router(dataset_router)
+router.include_router(panel_router)
+router.include_router(country_router)
+router.include_router(batch_router)
+router.include_router(admin_router)
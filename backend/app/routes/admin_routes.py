@@ -0,0 +1,80 @@
+import hmac
+import os
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse
+from starlette.concurrency import run_in_threadpool
+from app.profiler import ProfilerBusy, Sampler, profiler
+from app.reload import store_reloader
+from app.startup import startup_timings
+
+# Clients must send this token in X-Admin-Token. Without it configured the admin endpoints do not exist
+# (404): the client address cannot be trusted behind a reverse proxy on the same host.
+ADMIN_TOKEN = os.environ.get("OLYMPIQ_ADMIN_TOKEN")
+
+def require_admin(request: Request):
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    token = request.headers.get("x-admin-token", "")
+    if not hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(require_admin)])
+
+# Load the processed files again if they changed (or always, with force) and swap the new data in;
+# requests already running finish on the previous version
+@router.post("/reload")
+async def reload_data(force: bool = False):
+    try:
+        return await run_in_threadpool(store_reloader.reload, force)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Reload failed, still serving the previous data: {e}")
+
+# Version being served, version of the files on disk, and the last reload
+@router.get("/data-version")
+async def get_data_version():
+    return store_reloader.status()
+
+# Time spent per import, dataset load and warm-up step while this worker started
+@router.get("/startup")
+async def get_startup_report():
+    return startup_timings.report()
+
+def collapsed_response(sampler: Sampler, **headers) -> PlainTextResponse:
+    headers = {"X-Profile-Samples": str(sampler.samples), "X-Profile-Seconds": f"{sampler.sampled_seconds:.3f}", **headers}
+    return PlainTextResponse(sampler.collapsed(), headers=headers)
+
+# Sample every thread of this worker for a while; collapsed stacks for a flamegraph
+@router.post("/profile", response_class=PlainTextResponse)
+async def profile_worker(
+    seconds: float = Query(5.0, gt=0, le=60),
+    interval_ms: float = Query(10.0, ge=1, le=1000),
+    idle: bool = False,
+):
+    try:
+        sampler = await profiler.profile_for(seconds, interval_ms / 1000, idle)
+    except ProfilerBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return collapsed_response(sampler)
+
+# Sample while the next `count` requests to a route (template as in the docs, e.g.
+# /api/medals/{country}) are handled; fewer when `timeout` passes first
+@router.post("/profile/requests", response_class=PlainTextResponse)
+async def profile_requests(
+    request: Request,
+    route: str,
+    method: Optional[str] = None,
+    count: int = Query(1, ge=1, le=1000),
+    timeout: float = Query(60.0, gt=0, le=600),
+    interval_ms: float = Query(5.0, ge=1, le=1000),
+    idle: bool = False,
+):
+    if route not in request.app.openapi()["paths"]:
+        raise HTTPException(status_code=404, detail=f"Unknown route: {route}")
+    try:
+        sampler, profiled = await profiler.profile_requests(route, method, count, timeout, interval_ms / 1000, idle)
+    except ProfilerBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if profiled == 0:
+        raise HTTPException(status_code=504, detail=f"No request to {route} within {timeout:g}s")
+    return collapsed_response(sampler, **{"X-Profiled-Requests": str(profiled)})
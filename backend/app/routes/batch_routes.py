@@ -0,0 +1,93 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
+from app.cache import Payload, dumps, payload_response
+from app.query import FORMATS, ListQuery, query_payload
+from app.store import get_store
+
+router = APIRouter()
+
+# Joined and compressed bodies of recent bundles / batches (LRU), keyed by their fragments' ETags. Those
+# are content hashes, so an entry never outlives the data version it was built from.
+JOINED_CACHE_SIZE = int(os.environ.get("OLYMPIQ_BUNDLE_CACHE_SIZE", 32))
+_joined: "OrderedDict[str, Payload]" = OrderedDict()
+_joined_lock = threading.Lock()
+
+# Several JSON fragments as one object, {"<key>": <fragment>, ...}, spliced from their encoded bytes
+def _join(fragments: Dict[str, Payload]) -> bytes:
+    parts = [dumps(key) + b":" + payload.body for key, payload in fragments.items()]
+    return b"{" + b",".join(parts) + b"}"
+
+# The fragments as one payload, with gzip / brotli variants like the single-dataset payloads. The ETag
+# follows from the fragments' ETags, so a joined body is never hashed.
+async def _joined_payload(fragments: Dict[str, Payload]) -> Payload:
+    digest = hashlib.blake2b(",".join(f"{dumps(key).decode()}={payload.etag}" for key, payload in fragments.items()).encode(), digest_size=16)
+    key = digest.hexdigest()
+    with _joined_lock:
+        payload = _joined.get(key)
+        if payload is not None:
+            _joined.move_to_end(key)
+            return payload
+    # Compressing a few hundred KB takes tens of milliseconds; keep it off the event loop
+    payload = await run_in_threadpool(lambda: Payload(body=_join(fragments), etag=f'"{key}"').precompressed())
+    with _joined_lock:
+        _joined[key] = payload
+        while len(_joined) > JOINED_CACHE_SIZE:
+            _joined.popitem(last=False)
+    return payload
+
+def _dataset(name: str):
+    store = get_store()
+    if name not in store:
+        raise HTTPException(status_code=400, detail=f"Unknown dataset {name!r}. Choose from {store.names()}")
+    return store[name]
+
+# One sub-query of /batch: the parameters of the list endpoints, for one dataset
+class BatchQuery(BaseModel):
+    dataset: str
+    fields: Optional[List[str]] = None
+    year_from: Optional[int] = None
+    year_to: Optional[int] = None
+    countries: Optional[List[str]] = None
+    limit: Optional[int] = Field(None, ge=1)
+    offset: int = Field(0, ge=0)
+    format: Literal[FORMATS] = "records"
+
+    def to_query(self) -> ListQuery:
+        return ListQuery(
+            fields=tuple(self.fields) if self.fields is not None else None,
+            year_from=self.year_from,
+            year_to=self.year_to,
+            countries=tuple(self.countries) if self.countries else None,
+            limit=self.limit,
+            offset=self.offset,
+            format=self.format,
+        )
+
+# Full datasets in one response, e.g. /bundle?datasets=medals,population,political_stability.
+# Every fragment is the pre-encoded body of the dataset's own endpoint.
+@router.get("/bundle")
+async def get_bundle(
+    request: Request,
+    datasets: str = Query(..., description="Comma-separated dataset names (see /datasets)"),
+    format: Literal[FORMATS] = Query("records", description="records or columns, as on the list endpoints"),
+):
+    names = list(dict.fromkeys(part.strip() for part in datasets.split(",") if part.strip()))
+    query = ListQuery(format=format)
+    fragments = {name: query_payload(_dataset(name), query)[0] for name in names}
+    return payload_response(request, await _joined_payload(fragments))
+
+# Named sub-queries in one round trip:
+#   {"medals": {"dataset": "medals", "fields": ["Total"], "year_from": 2016},
+#    "population": {"dataset": "population", "format": "columns"}}
+# answers {"medals": [...], "population": {...}}; unfiltered sub-queries reuse the pre-encoded bodies
+@router.post("/batch")
+async def post_batch(request: Request, queries: Dict[str, BatchQuery]):
+    fragments = {key: query_payload(_dataset(query.dataset), query.to_query())[0] for key, query in queries.items()}
+    return payload_response(request, await _joined_payload(fragments))
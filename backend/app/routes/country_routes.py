@@ -0,0 +1,28 @@
+from fastapi import APIRouter, HTTPException, Request
+from app.cache import Payload, payload_response
+from app.store import get_store
+
+router = APIRouter()
+
+def _payload() -> Payload:
+    return get_store().derived("countries_payload", lambda store: Payload.from_obj(_records(store.countries.frame)).precompressed())
+
+def _records(frame):
+    records = frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+    for record in records:
+        record["aliases"] = record["aliases"].split("|") if record["aliases"] else []
+    return records
+
+# The country dimension: id, NOC, Olympic / World Bank names, ISO3 code and aliases of every country
+@router.get("/countries")
+async def get_countries(request: Request):
+    return payload_response(request, _payload())
+
+# One country looked up by any name, alias, NOC or ISO3 code
+@router.get("/countries/{country}")
+async def get_country(country: str):
+    countries = get_store().countries
+    country_id = countries.resolve(country)
+    if country_id is None:
+        raise HTTPException(status_code=404, detail="Country not found")
+    return _records(countries.frame[countries.frame["country_id"] == country_id])[0]
@@ -0,0 +1,15 @@
+from fastapi import APIRouter
+from app.store import get_store
+
+router = APIRouter()
+
+# Rows, columns and in-memory size of every dataset held by the store
+@router.get("/datasets")
+async def get_dataset_memory():
+    store = get_store()
+    report = store.memory_report()
+    return {
+        "version": store.version,
+        "datasets": report,
+        "total_memory_bytes": sum(entry["memory_bytes"] for entry in report),
+    }
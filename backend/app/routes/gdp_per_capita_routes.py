@@ -1,36 +1,37 @@
-from fastapi import APIRouter, HTTPException
-import pandas as pd
+from fastapi import APIRouter, Depends, HTTPException, Request
+from app.metrics import timed
+from app.query import ListQuery, list_query, list_response
+from app.store import get_store, to_records
 
 router = APIRouter()
 
-# Load the GDP per capita dataset
-gdp_pc_file_path = "/Users/miheergautam/Documents/GitHub/OLYMPIQ-Visual-Analytics/backend/app/data/processed/gdp_per_capita_cleaned.csv"  
-gdp_data = pd.read_csv(gdp_pc_file_path)
-
-gdp_data.rename(columns={"Country Name": "Country"}, inplace=True)
+# GDP per capita dataset ("Country Name" is normalised to "Country" by the store)
+def gdp_per_capita():
+    return get_store()["gdp_per_capita"]
 
 @router.get("/gdp-per-capita")
-async def get_all_gdp_per_capita():
-    return gdp_data.to_dict(orient="records")
+async def get_all_gdp_per_capita(request: Request, query: ListQuery = Depends(list_query)):
+    return list_response(request, gdp_per_capita(), query)
 
 @router.get("/gdp-per-capita/{country}")
 async def get_gdp_per_capita_by_country(country: str):
-    filtered = gdp_data[gdp_data["Country"].str.lower() == country.lower()]
+    filtered = gdp_per_capita().by_country(country)
     if filtered.empty:
         raise HTTPException(status_code=404, detail="Country not found")
-    return filtered.to_dict(orient="records")
+    return to_records(filtered)
 
 @router.get("/gdp-per-capita/year/{year}")
 async def get_gdp_per_capita_by_year(year: int):
-    filtered = gdp_data[gdp_data["Year"] == year]
+    filtered = gdp_per_capita().by_year(year)
     if filtered.empty:
         raise HTTPException(status_code=404, detail="Year not found")
-    return filtered.to_dict(orient="records")
+    return to_records(filtered)
 
 @router.get("/gdp-per-capita/top/{year}")
 async def get_top_gdp_per_capita(year: int, top_n: int = 10):
-    filtered = gdp_data[gdp_data["Year"] == year]
+    filtered = gdp_per_capita().by_year(year)
     if filtered.empty:
         raise HTTPException(status_code=404, detail="Year not found")
-    top = filtered.sort_values(by="GDP per capita", ascending=False).head(top_n)
-    return top.to_dict(orient="records")
+    with timed("filter"):
+        top = filtered.sort_values(by="GDP per capita", ascending=False).head(top_n)
+    return to_records(top)
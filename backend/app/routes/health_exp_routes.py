@@ -1,43 +1,39 @@
-from fastapi import APIRouter
-import pandas as pd
-import numpy as np
+from fastapi import APIRouter, Depends, Request
+from app.query import ListQuery, list_query, list_response
+from app.store import get_store, to_records
 
 router = APIRouter()
 
-data_file_path = "/Users/miheergautam/Documents/GitHub/OLYMPIQ-Visual-Analytics/backend/app/data/processed/health_expenditure_cleaned.csv"
-data = pd.read_csv(data_file_path)
-
-# Convert empty strings to NaN, then replace NaN with None for JSON-safe output
-data = data.replace(r'^\s*$', np.nan, regex=True).replace({np.nan: None})
+# Health expenditure dataset; blank cells are served as null
+def health():
+    return get_store()["health_exp"]
 
 @router.get("/health")
-async def get_all_health_data():
-    return data.to_dict(orient="records")
+async def get_all_health_data(request: Request, query: ListQuery = Depends(list_query)):
+    return list_response(request, health(), query)
 
 @router.get("/health/years")
 async def get_all_years():
-    years = sorted(data["Year"].dropna().unique().tolist())
+    years = health().years()
     return {"years": years}
 
 @router.get("/health/year/{year}")
 async def get_health_by_year(year: int):
-    filtered_data = data[data["Year"] == year]
+    filtered_data = health().by_year(year)
     if filtered_data.empty:
         return {"error": "No data for this year"}
-    return filtered_data.to_dict(orient="records")
+    return to_records(filtered_data)
 
 @router.get("/health/country/{country}")
 async def get_health_by_country(country: str):
-    filtered_data = data[data["Country"].str.lower() == country.lower()]
+    filtered_data = health().by_country(country)
     if filtered_data.empty:
         return {"error": "Country not found"}
-    return filtered_data.to_dict(orient="records")
+    return to_records(filtered_data)
 
 @router.get("/health/country/{country}/year/{year}")
 async def get_health_by_country_and_year(country: str, year: int):
-    filtered_data = data[
-        (data["Country"].str.lower() == country.lower()) & (data["Year"] == year)
-    ]
+    filtered_data = health().by_country_year(country, year)
     if filtered_data.empty:
         return {"error": "No data for this country and year"}
-    return filtered_data.to_dict(orient="records")
+    return to_records(filtered_data)
@@ -1,39 +1,39 @@
-from fastapi import APIRouter
-import pandas as pd
+from fastapi import APIRouter, Depends, Request
+from app.query import ListQuery, list_query, list_response
+from app.store import get_store, to_records
 
 router = APIRouter()
 
-data_file_path = "/Users/miheergautam/Documents/GitHub/OLYMPIQ-Visual-Analytics/backend/app/data/processed/life_expectancy_cleaned.csv"
-data = pd.read_csv(data_file_path)
+# Life expectancy dataset
+def life_expectancy():
+    return get_store()["life_expectancy"]
 
 @router.get("/life")
-async def get_all_life_expectancy():
-    return data.to_dict(orient="records")
+async def get_all_life_expectancy(request: Request, query: ListQuery = Depends(list_query)):
+    return list_response(request, life_expectancy(), query)
 
 @router.get("/life/years")
 async def get_all_years():
-    years = sorted(data["Year"].dropna().unique().tolist())
+    years = life_expectancy().years()
     return {"years": years}
 
 @router.get("/life/year/{year}")
 async def get_life_by_year(year: int):
-    filtered_data = data[data["Year"] == year]
+    filtered_data = life_expectancy().by_year(year)
     if filtered_data.empty:
         return {"error": "No data for this year"}
-    return filtered_data.to_dict(orient="records")
+    return to_records(filtered_data)
 
 @router.get("/life/country/{country}")
 async def get_life_by_country(country: str):
-    filtered_data = data[data["Country"].str.lower() == country.lower()]
+    filtered_data = life_expectancy().by_country(country)
     if filtered_data.empty:
         return {"error": "Country not found"}
-    return filtered_data.to_dict(orient="records")
+    return to_records(filtered_data)
 
 @router.get("/life/country/{country}/year/{year}")
 async def get_life_by_country_and_year(country: str, year: int):
-    filtered_data = data[
-        (data["Country"].str.lower() == country.lower()) & (data["Year"] == year)
-    ]
+    filtered_data = life_expectancy().by_country_year(country, year)
     if filtered_data.empty:
         return {"error": "No data for this country and year"}
-    return filtered_data.to_dict(orient="records")
+    return to_records(filtered_data)
@@ -1,64 +1,44 @@
-from fastapi import APIRouter, HTTPException
-import pandas as pd
-import os
+from fastapi import APIRouter, Depends, HTTPException, Request
+from app.query import ListQuery, list_query, list_response
+from app.store import get_store, to_records
 
 router = APIRouter()
 
-# Update this path based on your actual file location
-data_file_path = "/Users/miheergautam/Documents/GitHub/OLYMPIQ-Visual-Analytics/backend/app/data/processed/literacy_rate_cleaned.csv"
-
-# Load the dataset
-try:
-    data = pd.read_csv(data_file_path)
-    data.columns = data.columns.str.strip()  # In case of trailing spaces
-except Exception as e:
-    print(f"Error loading literacy rate CSV: {e}")
-    data = pd.DataFrame()
+# Literacy rate dataset; mostly blank cells, served as null
+def literacy():
+    return get_store()["literacy_rate"]
 
 # Route to return all literacy rate data
 @router.get("/literacy")
-async def get_all_literacy_data():
-    if data.empty:
-        raise HTTPException(status_code=500, detail="Literacy data not available")
-    return data.to_dict(orient="records")
+async def get_all_literacy_data(request: Request, query: ListQuery = Depends(list_query)):
+    return list_response(request, literacy(), query)
 
 # Route to return all available years
 @router.get("/literacy/years")
 async def get_literacy_years():
-    if data.empty:
-        raise HTTPException(status_code=500, detail="Data not loaded")
-    years = sorted(data["Year"].dropna().unique().tolist())
+    years = literacy().years()
     return {"years": years}
 
 # Route to get data by year
 @router.get("/literacy/year/{year}")
 async def get_literacy_by_year(year: int):
-    if data.empty:
-        raise HTTPException(status_code=500, detail="Data not loaded")
-    filtered = data[data["Year"] == year]
+    filtered = literacy().by_year(year)
     if filtered.empty:
         raise HTTPException(status_code=404, detail="No data for this year")
-    return filtered.to_dict(orient="records")
+    return to_records(filtered)
 
 # Route to get data by country
 @router.get("/literacy/country/{country}")
 async def get_literacy_by_country(country: str):
-    if data.empty:
-        raise HTTPException(status_code=500, detail="Data not loaded")
-    filtered = data[data["Country"].str.lower() == country.lower()]
+    filtered = literacy().by_country(country)
     if filtered.empty:
         raise HTTPException(status_code=404, detail="Country not found")
-    return filtered.to_dict(orient="records")
+    return to_records(filtered)
 
 # Route to get data by country and year
 @router.get("/literacy/country/{country}/year/{year}")
 async def get_literacy_by_country_and_year(country: str, year: int):
-    if data.empty:
-        raise HTTPException(status_code=500, detail="Data not loaded")
-    filtered = data[
-        (data["Country"].str.lower() == country.lower()) &
-        (data["Year"] == year)
-    ]
+    filtered = literacy().by_country_year(country, year)
     if filtered.empty:
         raise HTTPException(status_code=404, detail="No data for this country and year")
-    return filtered.to_dict(orient="records")
+    return to_records(filtered)
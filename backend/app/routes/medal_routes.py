@@ -1,51 +1,87 @@
-from fastapi import APIRouter
-import pandas as pd
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from app.cache import payload_response
+from app.medal_analytics import RANKINGS, get_medal_analytics
+from app.metrics import timed
+from app.query import ListQuery, list_query, list_response
+from app.store import get_store, to_records
 
 router = APIRouter()
 
-data_file_path = "/Users/miheergautam/Documents/GitHub/OLYMPIQ-Visual-Analytics/backend/app/data/processed/medals.csv"
-data = pd.read_csv(data_file_path)
+def medals():
+    return get_store()["medals"]
 
 @router.get("/medals")
-async def get_medals():
-    return data.to_dict(orient="records")
+async def get_medals(request: Request, query: ListQuery = Depends(list_query)):
+    return list_response(request, medals(), query)
 
 @router.get("/medals/years")
 async def get_all_years():
-    years = sorted(data['Year'].unique().tolist())
-    return {"years": years}
+    return {"years": medals().years()}
 
 @router.get("/medals/year/{year}")
 async def get_medals_by_year(year: int):
-    filtered_data = data[data['Year'] == year]
+    filtered_data = medals().by_year(year)
     if filtered_data.empty:
         return {"error": "No data for this year"}
-    return filtered_data.to_dict(orient="records")
+    return to_records(filtered_data)
 
+# All-time totals per team, precomputed when the data loads
 @router.get("/medals/aggregate")
-async def get_aggregate_medals():
-    aggregated = data.groupby("Country")[["Gold", "Silver", "Bronze", "Total"]].sum().reset_index()
-    aggregated = aggregated.sort_values(by="Total", ascending=False)
-    return aggregated.to_dict(orient="records")
+async def get_aggregate_medals(request: Request):
+    return payload_response(request, get_medal_analytics().aggregate)
+
+# First medal, the Games with the most medals, and medals / teams / average per Games
+@router.get("/medals/summary")
+async def get_medal_summary(request: Request):
+    return payload_response(request, get_medal_analytics().summary)
+
+# Per country: all-time totals, first medal, best rank and the Games with the most medals
+@router.get("/medals/stats")
+async def get_country_stats(request: Request):
+    return payload_response(request, get_medal_analytics().stats_payload)
+
+@router.get("/medals/stats/{country}")
+async def get_country_stats_by_country(country: str):
+    country_id = get_store().countries.resolve(country)
+    stats = None if country_id is None else get_medal_analytics().country(country_id)
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Country not found")
+    return stats
+
+# Teams of one Games ranked by total medals or by golds first, with competition and dense ranks
+@router.get("/medals/rankings/{year}")
+async def get_rankings(
+    year: int,
+    by: str = Query("total", description="Ranking order: 'total' or 'gold' (golds, then silvers, then bronzes)"),
+    top_n: Optional[int] = Query(None, ge=1),
+):
+    if by not in RANKINGS:
+        raise HTTPException(status_code=400, detail=f"Invalid ranking. Choose from {list(RANKINGS)}")
+    ranking = get_medal_analytics().ranking(year, by, top_n)
+    if ranking is None:
+        raise HTTPException(status_code=404, detail="No data for this year")
+    return ranking
 
 @router.get("/medals/trend/{country}")
 async def get_medal_trend(country: str):
-    trend = data[data['Country'].str.lower() == country.lower()]
+    trend = medals().by_country(country)
     if trend.empty:
         return {"error": "Country not found"}
-    return trend.sort_values(by="Year").to_dict(orient="records")
+    with timed("filter"):
+        trend = trend.sort_values(by="Year")
+    return to_records(trend)
 
 @router.get("/medals/top/{year}")
 async def get_top_countries_by_year(year: int, top_n: int = 10):
-    year_data = data[data['Year'] == year]
-    if year_data.empty:
+    top_countries = get_medal_analytics().top(year, top_n)
+    if top_countries is None:
         return {"error": "No data for this year"}
-    top_countries = year_data.sort_values(by="Total", ascending=False).head(top_n)
-    return top_countries.to_dict(orient="records")
+    return top_countries
 
 @router.get("/medals/{country}")
 async def get_medals_by_country(country: str):
-    filtered_data = data[data['Country'].str.lower() == country.lower()]
+    filtered_data = medals().by_country(country)
     if filtered_data.empty:
         return {"error": "Country not found"}
-    return filtered_data.to_dict(orient="records")
\ No newline at end of file
+    return to_records(filtered_data)
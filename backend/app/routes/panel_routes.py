@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends, Request
+from app.panel import PANEL_COLUMNS
+from app.query import ListQuery, list_query, list_response
+from app.store import get_store
+
+router = APIRouter()
+
+def panel():
+    return get_store()["panel"]
+
+# Every indicator and the medal counts by (country, year), optionally narrowed down
+@router.get("/panel")
+async def get_panel(request: Request, query: ListQuery = Depends(list_query)):
+    return list_response(request, panel(), query)
+
+# Column names accepted by the fields parameter
+@router.get("/panel/fields")
+async def get_panel_fields():
+    return list(PANEL_COLUMNS)
@@ -1,43 +1,39 @@
-from fastapi import APIRouter
-import pandas as pd
-import numpy as np
+from fastapi import APIRouter, Depends, Request
+from app.query import ListQuery, list_query, list_response
+from app.store import get_store, to_records
 
 router = APIRouter()
 
-data_file_path = "/Users/miheergautam/Documents/GitHub/OLYMPIQ-Visual-Analytics/backend/app/data/processed/urban_population_cleaned.csv"
-data = pd.read_csv(data_file_path)
-
-# Replace NaN with None for JSON serialization
-data = data.replace({np.nan: None})
+# Urban population dataset; missing values are served as null
+def urban():
+    return get_store()["urban_population"]
 
 @router.get("/urban")
-async def get_all_urban_data():
-    return data.to_dict(orient="records")
+async def get_all_urban_data(request: Request, query: ListQuery = Depends(list_query)):
+    return list_response(request, urban(), query)
 
 @router.get("/urban/years")
 async def get_all_years():
-    years = sorted(data["Year"].unique().tolist())
+    years = urban().years()
     return {"years": years}
 
 @router.get("/urban/year/{year}")
 async def get_urban_by_year(year: int):
-    filtered_data = data[data["Year"] == year]
+    filtered_data = urban().by_year(year)
     if filtered_data.empty:
         return {"error": "No data for this year"}
-    return filtered_data.to_dict(orient="records")
+    return to_records(filtered_data)
 
 @router.get("/urban/country/{country}")
 async def get_urban_by_country(country: str):
-    filtered_data = data[data["Country"].str.lower() == country.lower()]
+    filtered_data = urban().by_country(country)
     if filtered_data.empty:
         return {"error": "Country not found"}
-    return filtered_data.to_dict(orient="records")
+    return to_records(filtered_data)
 
 @router.get("/urban/country/{country}/year/{year}")
 async def get_urban_by_country_and_year(country: str, year: int):
-    filtered_data = data[
-        (data["Country"].str.lower() == country.lower()) & (data["Year"] == year)
-    ]
+    filtered_data = urban().by_country_year(country, year)
     if filtered_data.empty:
         return {"error": "No data for this country and year"}
-    return filtered_data.to_dict(orient="records")
+    return to_records(filtered_data)
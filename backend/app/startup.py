@@ -0,0 +1,88 @@
+# app/startup.py
+#
+# Cold-start timing. Each phase of a worker's startup (imports of the app modules, loading every dataset,
+# building the derived tables, importing the scikit-learn / scipy stacks) is timed here; the breakdown
+# is logged once the worker is ready and served by GET /api/admin/startup. Only the standard library
+# is imported, so this module can be imported first and time everything after it.
+import importlib
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Modules only needed by the correlation, clustering and PCA endpoints; imported on first use, or by
+# the warm-up thread once the worker accepts requests
+HEAVY_MODULES = ("scipy.stats", "sklearn.preprocessing", "sklearn.cluster", "sklearn.decomposition")
+
+# "background": load the data before serving, build derived tables and import HEAVY_MODULES in a thread
+# afterwards; "startup": do all of it before serving; "lazy": leave everything to the first request
+WARMUP = os.environ.get("OLYMPIQ_WARMUP", "background")
+
+
+class StartupTimings:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.ready: Optional[float] = None
+        self.warmed: Optional[float] = None
+        self._phases: List[dict] = []
+        self._lock = threading.Lock()
+
+    # Time one phase; kind is "import", "load" or "warm"
+    @contextmanager
+    def phase(self, name: str, kind: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, kind, time.perf_counter() - start)
+
+    def record(self, name: str, kind: str, seconds: float):
+        with self._lock:
+            self._phases.append({
+                "phase": name,
+                "kind": kind,
+                "seconds": round(seconds, 4),
+                "thread": threading.current_thread().name,
+            })
+
+    def mark_ready(self):
+        self.ready = time.perf_counter()
+
+    def mark_warmed(self):
+        self.warmed = time.perf_counter()
+
+    def report(self) -> dict:
+        with self._lock:
+            phases = list(self._phases)
+        by_kind: Dict[str, float] = {}
+        for phase in phases:
+            by_kind[phase["kind"]] = round(by_kind.get(phase["kind"], 0.0) + phase["seconds"], 4)
+        return {
+            "warmup": WARMUP,
+            "ready_seconds": None if self.ready is None else round(self.ready - self.started, 4),
+            "warmed_seconds": None if self.warmed is None else round(self.warmed - self.started, 4),
+            "seconds_by_kind": by_kind,
+            "phases": phases,
+        }
+
+    def log(self):
+        report = self.report()
+        lines = [f"  {p['kind']:<6} {p['seconds']:>8.3f}s  {p['phase']}" for p in report["phases"]]
+        logger.info("Startup ready in %ss (%s):\n%s", report["ready_seconds"], report["seconds_by_kind"], "\n".join(lines))
+
+
+startup_timings = StartupTimings()
+
+
+# Import a module and record how long it took, unless something imported it already
+def timed_import(name: str):
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    with startup_timings.phase(name, "import"):
+        return importlib.import_module(name)
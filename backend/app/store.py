@@ -0,0 +1,401 @@
+# app/store.py
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from app.arrow import ARROW_STREAM, to_arrow_stream
+from app.cache import Payload
+from app.columnar import COLUMNAR_DIR, read_columnar
+from app.countries import COUNTRIES_FILENAME, CountryDimension
+from app.metrics import timed
+from app.panel import PANEL_COLUMNS, PANEL_FILENAME
+
+DATA_DIR = Path(__file__).resolve().parent / "data" / "processed"
+
+
+# Describes one processed dataset and how to type its columns
+@dataclass(frozen=True)
+class DatasetSpec:
+    name: str
+    filename: str
+    value_columns: Tuple[str, ...]
+    value_dtype: str = "float64"
+    rename: Dict[str, str] = field(default_factory=dict)
+    # Column of processed/countries.csv used as the "Country" label of each row; None when the file
+    # keeps its own labels next to country_id (medal rows name the team that competed)
+    country_names: Optional[str] = "world_bank_name"
+
+
+DATASET_SPECS = {
+    spec.name: spec
+    for spec in [
+        DatasetSpec("medals", "medals.csv", ("Gold", "Silver", "Bronze", "Total"), value_dtype="int16", country_names=None),
+        DatasetSpec("gdp", "gdp_total_cleaned.csv", ("GDP (total)",)),
+        DatasetSpec(
+            "gdp_per_capita",
+            "gdp_per_capita_cleaned.csv",
+            ("GDP per capita",),
+            # The only source relabelled with Olympic names by the ETL
+            country_names="name",
+        ),
+        DatasetSpec("education_exp", "education_expenditure_cleaned.csv", ("Education Exp (%GDP)",)),
+        DatasetSpec("health_exp", "health_expenditure_cleaned.csv", ("Health Exp (%GDP)",)),
+        DatasetSpec("life_expectancy", "life_expectancy_cleaned.csv", ("Life Expectancy",)),
+        DatasetSpec("literacy_rate", "literacy_rate_cleaned.csv", ("Literacy Rate (% 15+)",)),
+        DatasetSpec("political_stability", "political_stability_cleaned.csv", ("Political Stability Index",)),
+        DatasetSpec("population", "population_cleaned.csv", ("Population",)),
+        DatasetSpec("urban_population", "urban_population_cleaned.csv", ("Urban Population (%)",)),
+        # Every indicator above joined on (country id, year); built by python -m app.panel
+        DatasetSpec("panel", PANEL_FILENAME, tuple(PANEL_COLUMNS), country_names="name"),
+    ]
+}
+
+
+# Version of the processed files a store is loaded from: a short hash of the name, size and modification
+# time of every file the store reads (columnar copies are validated against their CSV, so the CSVs suffice)
+def data_version(data_dir: Path = DATA_DIR) -> str:
+    digest = hashlib.blake2b(digest_size=6)
+    for filename in [COUNTRIES_FILENAME, *(spec.filename for spec in DATASET_SPECS.values())]:
+        path = data_dir / filename
+        stat = path.stat() if path.exists() else None
+        digest.update(f"{filename}:{stat.st_size}:{stat.st_mtime_ns};".encode() if stat else f"{filename}:-;".encode())
+    return digest.hexdigest()
+
+
+# Read a processed CSV and shrink it to compact dtypes
+def read_csv_frame(spec: DatasetSpec, data_dir: Path = DATA_DIR) -> pd.DataFrame:
+    df = pd.read_csv(data_dir / spec.filename)
+    df.columns = df.columns.str.strip()
+    df = df.rename(columns=spec.rename)
+
+    df["country_id"] = df["country_id"].astype("int16")
+    if "Country" in df.columns:
+        df["Country"] = df["Country"].astype("category")
+    df["Year"] = df["Year"].astype("int16")
+    for column in spec.value_columns:
+        # Blank cells come through as NaN; anything non-numeric is treated the same way
+        values = pd.to_numeric(df[column], errors="coerce")
+        df[column] = values.astype(spec.value_dtype)
+    return df
+
+
+# Prefer the memory-mapped columnar copy; fall back to parsing the CSV when it is missing or stale
+def load_frame(spec: DatasetSpec, data_dir: Path = DATA_DIR) -> pd.DataFrame:
+    source = data_dir / spec.filename
+    columnar_root = COLUMNAR_DIR if data_dir == DATA_DIR else data_dir / "columnar"
+    frame = read_columnar(spec.name, source=source, root=columnar_root)
+    if frame is not None:
+        return frame
+    return read_csv_frame(spec, data_dir)
+
+
+# Add the "Country" label column after country_id
+def label_countries(frame: pd.DataFrame, spec: DatasetSpec, countries: CountryDimension) -> pd.DataFrame:
+    if spec.country_names is None:
+        return frame
+    labelled = frame.copy(deep=False)
+    labelled.insert(
+        labelled.columns.get_loc("country_id") + 1,
+        "Country",
+        countries.labels(frame["country_id"].to_numpy(), spec.country_names),
+    )
+    return labelled
+
+
+# Convert a frame to JSON-safe records (NaN -> None); country ids stay internal
+def to_records(frame: pd.DataFrame) -> List[dict]:
+    with timed("materialize"):
+        frame = frame.drop(columns="country_id", errors="ignore")
+        return frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+
+
+# Convert a frame to parallel arrays: each text column (Country) holds indexes into its own dictionary.
+#   {"columns": ["Country", "Year", "Population"], "rows": 2,
+#    "dictionaries": {"Country": ["Afghanistan"]}, "data": {"Country": [0, 0], "Year": [2000, 2001], "Population": [...]}}
+def to_columns(frame: pd.DataFrame) -> dict:
+    with timed("materialize"):
+        return _to_columns(frame)
+
+
+def _to_columns(frame: pd.DataFrame) -> dict:
+    frame = frame.drop(columns="country_id", errors="ignore")
+    dictionaries = {}
+    data = {}
+    for column in frame.columns:
+        series = frame[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.cat.remove_unused_categories()
+            dictionaries[column] = series.cat.categories.tolist()
+            data[column] = series.cat.codes.tolist()
+        elif pd.api.types.is_float_dtype(series.dtype):
+            values = series.to_numpy()
+            data[column] = np.where(np.isnan(values), None, values).tolist()
+        else:
+            data[column] = series.tolist()
+    return {"columns": list(frame.columns), "rows": len(frame), "dictionaries": dictionaries, "data": data}
+
+
+Rows = Union[slice, np.ndarray]
+
+
+# Turn a sorted array of row positions into a slice when it is contiguous
+def _as_rows(positions: np.ndarray) -> Rows:
+    if len(positions) and positions[-1] - positions[0] + 1 == len(positions):
+        return slice(int(positions[0]), int(positions[-1]) + 1)
+    return positions
+
+
+def _positions(rows: Rows) -> np.ndarray:
+    if isinstance(rows, slice):
+        return np.arange(rows.start, rows.stop)
+    return rows
+
+
+class Dataset:
+    def __init__(self, spec: DatasetSpec, frame: pd.DataFrame, countries: CountryDimension):
+        self.spec = spec
+        self.frame = frame
+        self.countries = countries
+        self._build_indexes()
+
+    @property
+    def name(self) -> str:
+        return self.spec.name
+
+    # Hash indexes from country id / year to row positions, built once per load
+    def _build_indexes(self):
+        ids = self.frame["country_id"]
+        years = self.frame["Year"]
+
+        self.country_index: Dict[int, Rows] = {
+            int(country_id): _as_rows(rows) for country_id, rows in ids.groupby(ids, sort=False).indices.items()
+        }
+        self.year_index: Dict[int, Rows] = {
+            int(year): _as_rows(rows) for year, rows in years.groupby(years).indices.items()
+        }
+        self.country_year_index: Dict[Tuple[int, int], Rows] = {
+            (int(country_id), int(year)): _as_rows(rows)
+            for (country_id, year), rows in self.frame.groupby([ids, years], sort=False).indices.items()
+        }
+        # Where Country is the source's own label (medals: the team that competed, e.g. "ROC"), by-country
+        # lookups match that label case-insensitively (as before the country dimension) instead of merging every team of a country
+        self.label_index: Optional[Dict[str, Rows]] = None
+        self.label_year_index: Optional[Dict[Tuple[str, int], Rows]] = None
+        if self.spec.country_names is None:
+            labels = self.frame["Country"].astype("str").str.lower()
+            self.label_index = {
+                label: _as_rows(rows) for label, rows in labels.groupby(labels, sort=False).indices.items()
+            }
+            self.label_year_index = {
+                (label, int(year)): _as_rows(rows)
+                for (label, year), rows in self.frame.groupby([labels, years], sort=False).indices.items()
+            }
+
+    def _take(self, rows: Optional[Rows]) -> pd.DataFrame:
+        with timed("filter"):
+            if rows is None:
+                return self.frame.iloc[0:0]
+            return self.frame.iloc[rows]
+
+    # Any spelling of the country (name, World Bank name, alias, NOC, ISO3) finds its rows; for datasets
+    # labelled by the source, the label itself
+    def by_country(self, country: str) -> pd.DataFrame:
+        if self.label_index is not None:
+            return self._take(self.label_index.get(country.lower()))
+        return self._take(self.country_index.get(self.countries.resolve(country)))
+
+    def by_year(self, year: int) -> pd.DataFrame:
+        return self._take(self.year_index.get(year))
+
+    def by_country_year(self, country: str, year: int) -> pd.DataFrame:
+        if self.label_year_index is not None:
+            return self._take(self.label_year_index.get((country.lower(), year)))
+        return self._take(self.country_year_index.get((self.countries.resolve(country), year)))
+
+    def years(self) -> List[int]:
+        return sorted(self.year_index)
+
+    # Columns returned with every row: everything but the internal id and the value columns
+    @cached_property
+    def key_columns(self) -> List[str]:
+        return [column for column in self.frame.columns if column != "country_id" and column not in self.spec.value_columns]
+
+    # Rows in a year range and/or of some countries, found through the indexes, in dataset order;
+    # fields=None keeps every value column
+    def select(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        country_ids: Optional[Iterable[int]] = None,
+    ) -> pd.DataFrame:
+        with timed("filter"):
+            return self._select(fields, year_from, year_to, country_ids)
+
+    def _select(self, fields, year_from, year_to, country_ids) -> pd.DataFrame:
+        positions = None
+        if year_from is not None or year_to is not None:
+            parts = [
+                _positions(rows)
+                for year, rows in self.year_index.items()
+                if (year_from is None or year >= year_from) and (year_to is None or year <= year_to)
+            ]
+            positions = np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.intp)
+        if country_ids is not None:
+            parts = [_positions(self.country_index[country_id]) for country_id in set(country_ids) if country_id in self.country_index]
+            by_country = np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.intp)
+            positions = by_country if positions is None else np.intersect1d(positions, by_country, assume_unique=True)
+
+        frame = self.frame if positions is None else self.frame.iloc[positions]
+        if fields is None:
+            return frame
+        wanted = {"country_id", *self.key_columns, *fields}
+        return frame[[column for column in frame.columns if column in wanted]]
+
+    # The full dataset as encoded JSON records; the data only changes between ETL runs
+    @cached_property
+    def records_payload(self) -> Payload:
+        return Payload.from_obj(to_records(self.frame)).precompressed()
+
+    # The same, as parallel arrays (format=columns)
+    @cached_property
+    def columns_payload(self) -> Payload:
+        return Payload.from_obj(to_columns(self.frame)).precompressed()
+
+    # The same as an Arrow IPC stream (with country_id), built on the first Arrow request
+    @cached_property
+    def arrow_payload(self) -> Payload:
+        return Payload.from_bytes(to_arrow_stream(self.frame), media_type=ARROW_STREAM).precompressed()
+
+    # Country labels share their dictionary with every other dataset; it is reported once, under countries
+    def memory_bytes(self) -> int:
+        usage = self.frame.memory_usage(index=True, deep=True)
+        if self.spec.country_names is not None:
+            usage["Country"] = self.frame["Country"].cat.codes.nbytes
+        return int(usage.sum())
+
+
+# Holds one read-only copy of every processed dataset for the whole process
+class IndicatorStore:
+    def __init__(self, datasets: Dict[str, Dataset], countries: CountryDimension, version: str = ""):
+        self._datasets = datasets
+        self.countries = countries
+        self.version = version
+        self.load_seconds: Dict[str, float] = {}
+        self._derived: Dict[str, Any] = {}
+        self._derived_lock = threading.Lock()
+
+    @classmethod
+    def load(cls, data_dir: Path = DATA_DIR) -> "IndicatorStore":
+        # Taken before reading: files replaced during the load give a newer version on the next check
+        version = data_version(data_dir)
+        # Seconds spent per step, for the startup report
+        timings: Dict[str, float] = {}
+        start = time.perf_counter()
+        countries = CountryDimension.load(data_dir / COUNTRIES_FILENAME)
+        timings[COUNTRIES_FILENAME] = time.perf_counter() - start
+        datasets = {}
+        for name, spec in DATASET_SPECS.items():
+            start = time.perf_counter()
+            datasets[name] = Dataset(spec, label_countries(load_frame(spec, data_dir), spec, countries), countries)
+            timings[spec.filename] = time.perf_counter() - start
+        # Encode (and compress) the full-dataset responses up front so no request pays for it
+        start = time.perf_counter()
+        for dataset in datasets.values():
+            dataset.records_payload
+            dataset.columns_payload
+        timings["encode payloads"] = time.perf_counter() - start
+        store = cls(datasets, countries, version)
+        store.load_seconds = timings
+        return store
+
+    def __getitem__(self, name: str) -> Dataset:
+        return self._datasets[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._datasets
+
+    def names(self) -> List[str]:
+        return list(self._datasets)
+
+    # Frames are shared by every router; callers must not modify them in place
+    def frame(self, name: str) -> pd.DataFrame:
+        return self._datasets[name].frame
+
+    # Structures computed from the loaded frames (correlation tables, ...), built once per store
+    def derived(self, key: str, build: Callable[["IndicatorStore"], Any]) -> Any:
+        value = self._derived.get(key)
+        if value is None:
+            with self._derived_lock:
+                value = self._derived.get(key)
+                if value is None:
+                    value = build(self)
+                    self._derived[key] = value
+        return value
+
+    def memory_report(self) -> List[dict]:
+        return [
+            {
+                "dataset": dataset.name,
+                "file": dataset.spec.filename,
+                "rows": len(dataset.frame),
+                "columns": list(dataset.frame.columns),
+                "memory_bytes": dataset.memory_bytes(),
+            }
+            for dataset in self._datasets.values()
+        ] + [
+            {
+                "dataset": "countries",
+                "file": COUNTRIES_FILENAME,
+                "rows": len(self.countries),
+                "columns": list(self.countries.frame.columns),
+                "memory_bytes": self.countries.shared_bytes(),
+            }
+        ]
+
+
+_store: Optional[IndicatorStore] = None
+_store_lock = threading.Lock()
+# The store a request started with; see store_snapshot
+_pinned: ContextVar[Optional[IndicatorStore]] = ContextVar("pinned_store", default=None)
+
+
+# Return the store of the current request, or the process-wide store (loaded on first use)
+def get_store() -> IndicatorStore:
+    global _store
+    pinned = _pinned.get()
+    if pinned is not None:
+        return pinned
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = IndicatorStore.load()
+    return _store
+
+
+# Replace the process-wide store; requests already running keep the store they pinned
+def publish_store(store: IndicatorStore):
+    global _store
+    with _store_lock:
+        _store = store
+
+
+# Pin the current store for the duration of a request, so every get_store() call inside it sees the same
+# data even when a reload publishes a new store meanwhile
+@contextmanager
+def store_snapshot() -> Iterator[IndicatorStore]:
+    store = get_store()
+    token = _pinned.set(store)
+    try:
+        yield store
+    finally:
+        _pinned.reset(token)
@@ -1,16 +1,15 @@
 import React, { useEffect, useRef, useState } from "react";
 import * as d3 from "d3";
 import Select from "react-select";
-import {
-  useGetAllHealthExpenditureQuery,
-  useGetAllEducationExpenditureQuery,
-  useGetMedalsQuery,
-} from "../store/api";
+import { useGetBundleQuery } from "../store/api";
+
+const BUNDLE = ["health_exp", "education_exp", "medals"];
 
 const BubbleChart = () => {
-  const { data: healthData } = useGetAllHealthExpenditureQuery();
-  const { data: eduData } = useGetAllEducationExpenditureQuery();
-  const { data: medalsData } = useGetMedalsQuery();
+  const { data: bundle } = useGetBundleQuery({ datasets: BUNDLE });
+  const healthData = bundle?.health_exp;
+  const eduData = bundle?.education_exp;
+  const medalsData = bundle?.medals;
   const svgRef = useRef();
   const [joinedData, setJoinedData] = useState([]);
   const [selectedCountries, setSelectedCountries] = useState([]);
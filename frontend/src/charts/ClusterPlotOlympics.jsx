@@ -1,17 +1,10 @@
 import React, { useEffect, useRef, useState } from "react";
 import * as d3 from "d3";
 import Select from "react-select";
-import {
-  useGetAllPopulationQuery,
-  useGetAllStabilityQuery,
-  useGetMedalsQuery,
-} from "../store/api";
 
 const ClusterPlotOlympics = () => {
-  const { data: populationData } = useGetAllPopulationQuery();
-  const { data: stabilityData } = useGetAllStabilityQuery();
-  const { data: medalsData } = useGetMedalsQuery();
   const svgRef = useRef();
+  const [yearData, setYearData] = useState([]);
   const [mergedData, setMergedData] = useState([]);
   const [selectedYear, setSelectedYear] = useState(2000);
   const [selectedCountries, setSelectedCountries] = useState([]);
@@ -20,63 +13,24 @@ const ClusterPlotOlympics = () => {
   const handleCountryChange = (opts) =>
     setSelectedCountries(opts ? opts.map((o) => o.value) : []);
 
+  // The backend assembles the (country, population, psi, medals) matrix for the year
   useEffect(() => {
-    if (!populationData || !stabilityData || !medalsData) return;
-
-    const parse = (v) => (isNaN(+v) ? NaN : +v);
-
-    const popMap = d3.group(populationData, (d) => d.Country + ":" + d.Year);
-    const stabMap = d3.group(stabilityData, (d) => d.Country + ":" + d.Year);
-    const medalMap = d3.rollup(
-      medalsData,
-      (v) => d3.sum(v, (d) => d.Gold + d.Silver + d.Bronze),
-      (d) => d.Country + ":" + d.Year
-    );
-
-    const avgPSI = d3.rollup(
-      stabilityData.filter((d) => !isNaN(parse(d["Political Stability Index"]))),
-      (v) => d3.mean(v, (d) => parse(d["Political Stability Index"])),
-      (d) => d.Country
-    );
-
-    const avgPop = d3.rollup(
-      populationData.filter((d) => !isNaN(parse(d.Population))),
-      (v) => d3.mean(v, (d) => parse(d.Population)),
-      (d) => d.Country
-    );
-
-    const final = [];
-    new Set(populationData.map((d) => d.Country)).forEach((country) => {
-      const key = country + ":" + selectedYear;
-      const popEntry = popMap.get(key)?.[0];
-      const stabEntry = stabMap.get(key)?.[0];
-
-      const population = popEntry ? parse(popEntry.Population) : avgPop.get(country) || 0;
-      const psi = stabEntry ? parse(stabEntry["Political Stability Index"]) : avgPSI.get(country) || 0;
-      const medals = medalMap.get(key) || 0;
-
-      if (!isNaN(population) && !isNaN(psi) && !isNaN(medals)) {
-        final.push({ country, population, psi, medals });
-      }
-    });
-
-    fetch("http://localhost:8000/api/clusteranalysis/cluster", {
-      method: "POST",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify(final),
-    })
+    fetch(`http://localhost:8000/api/clusteranalysis/cluster?year=${selectedYear}&k=4`)
       .then((r) => {
         if (!r.ok) throw new Error(`HTTP ${r.status}`);
         return r.json();
       })
-      .then((clustered) => {
-        const filtered = selectedCountries.length
-          ? clustered.filter((d) => selectedCountries.includes(d.country))
-          : clustered;
-        setMergedData(filtered);
-      })
+      .then(setYearData)
       .catch(console.error);
-  }, [populationData, stabilityData, medalsData, selectedYear, selectedCountries]);
+  }, [selectedYear]);
+
+  useEffect(() => {
+    setMergedData(
+      selectedCountries.length
+        ? yearData.filter((d) => selectedCountries.includes(d.country))
+        : yearData
+    );
+  }, [yearData, selectedCountries]);
 
   useEffect(() => {
     if (!mergedData.length) return;
@@ -148,9 +102,7 @@ const ClusterPlotOlympics = () => {
       .text("Political Stability Index (PSI)");
   }, [mergedData]);
 
-  const allCountries = populationData
-    ? Array.from(new Set(populationData.map((d) => d.Country))).sort()
-    : [];
+  const allCountries = Array.from(new Set(yearData.map((d) => d.country))).sort();
 
   return (
     <div className="p-6 text-white bg-neutral-800 shadow-md rounded-xl max-w-5xl space-y-6">
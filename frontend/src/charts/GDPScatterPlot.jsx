@@ -1,5 +1,5 @@
 import React, { useEffect, useRef, useState } from "react";
-import { useGetAllGDPQuery, useGetAllGDPPerCapitaQuery } from "../store/api";
+import { useGetPanelQuery } from "../store/api";
 import * as d3 from "d3";
 
 const GDPScatterPlot = () => {
@@ -7,56 +7,40 @@ const GDPScatterPlot = () => {
   const svgRef = useRef(null);
   const tooltipRef = useRef(null);  // Tooltip reference
 
+  // GDP total and per capita for the selected year, already aligned by country on the server
   const {
-    data: gdpData,
-    error: gdpError,
-    isLoading: isLoadingGDP,
-  } = useGetAllGDPQuery();
-
-  const {
-    data: gdpPerCapitaData,
-    error: gdpPerCapitaError,
-    isLoading: isLoadingGDPPerCapita,
-  } = useGetAllGDPPerCapitaQuery();
+    data: panelData,
+    error,
+    isLoading,
+  } = useGetPanelQuery({
+    fields: "gdp,gdp_per_capita",
+    year_from: selectedYear,
+    year_to: selectedYear,
+  });
 
   const [mergedData, setMergedData] = useState([]);
 
   useEffect(() => {
-    if (gdpData && gdpPerCapitaData) {
-      const gdpDataByYear = gdpData.filter((item) => item.Year === selectedYear);
-      const gdpPerCapitaDataByYear = gdpPerCapitaData.filter(
-        (item) => item.Year === selectedYear
-      );
-
-      const merged = gdpDataByYear
-        .map((gdp) => {
-          const gdpPerCapita = gdpPerCapitaDataByYear.find(
-            (item) => item.Country === gdp.Country
-          );
-          if (
-            gdpPerCapita &&
-            gdp["GDP (total)"] != null &&
-            gdpPerCapita["GDP per capita"] != null
-          ) {
-            const gdp_total = gdp["GDP (total)"];
-            const gdp_per_capita = gdpPerCapita["GDP per capita"];
-            const color = gdp_total > 1e13 || gdp_per_capita > 50000 ? "#ff0000" : `hsl(${Math.random() * 360}, 100%, 50%)`; // Outlier color red
-
-            return {
-              country: gdp.Country,
-              gdp_total,
-              gdp_per_capita,
-              color,
-            };
-          }
-          return null;
+    if (panelData) {
+      const merged = panelData
+        .filter((row) => row.gdp != null && row.gdp_per_capita != null)
+        .map((row) => {
+          const gdp_total = row.gdp;
+          const gdp_per_capita = row.gdp_per_capita;
+          const color = gdp_total > 1e13 || gdp_per_capita > 50000 ? "#ff0000" : `hsl(${Math.random() * 360}, 100%, 50%)`; // Outlier color red
+
+          return {
+            country: row.Country,
+            gdp_total,
+            gdp_per_capita,
+            color,
+          };
         })
-        .filter((item) => item !== null)
         .filter((item) => item.gdp_total > 0 && item.gdp_per_capita > 0);
 
       setMergedData(merged);
     }
-  }, [gdpData, gdpPerCapitaData, selectedYear]);
+  }, [panelData]);
 
   useEffect(() => {
     if (mergedData.length > 0) {
@@ -139,8 +123,8 @@ const GDPScatterPlot = () => {
     }
   }, [mergedData]);
 
-  if (isLoadingGDP || isLoadingGDPPerCapita) return <div className="loader">Loading...</div>;
-  if (gdpError || gdpPerCapitaError) return <p>Error fetching data</p>;
+  if (isLoading) return <div className="loader">Loading...</div>;
+  if (error) return <p>Error fetching data</p>;
 
   return (
     <div className="gdp-scatter-plot-container" style={{ position: "relative" }}>
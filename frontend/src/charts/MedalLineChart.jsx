@@ -3,6 +3,7 @@ import * as d3 from "d3";
 import { useGetMedalsQuery } from "../store/api";
 
 const MedalLineChart = () => {
+  // Same arguments as OlympicPerformanceChart, so the page loads the medal table once
   const { data: medalsData, isLoading, isError } = useGetMedalsQuery();
   const [selectedYear, setSelectedYear] = useState(null);
   const [selectedCountries, setSelectedCountries] = useState([]);
@@ -1,13 +1,13 @@
 import React, { useEffect, useState } from "react";
 import * as d3 from "d3";
-import {
-  useGetAllPopulationQuery,
-  useGetAllHealthExpenditureQuery,
-} from "../store/api";
+import { useGetBundleQuery } from "../store/api";
+
+const BUNDLE = ["population", "health_exp"];
 
 const MultiLineChart = () => {
-  const { data: populationData } = useGetAllPopulationQuery();
-  const { data: healthData } = useGetAllHealthExpenditureQuery();
+  const { data: bundle } = useGetBundleQuery({ datasets: BUNDLE });
+  const populationData = bundle?.population;
+  const healthData = bundle?.health_exp;
 
   const [selectedCountries, setSelectedCountries] = useState([]);
   const [allCountries, setAllCountries] = useState([]);
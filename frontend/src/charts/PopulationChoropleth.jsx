@@ -10,7 +10,10 @@ const PopulationChoropleth = () => {
   const [availableYears, setAvailableYears] = useState([]);
   const [topCountries, setTopCountries] = useState([]);
 
-  const { data: populationRawData, isLoading, isError } = useGetAllPopulationQuery();
+  // Parallel arrays: Country holds indexes into dictionaries.Country
+  const { data: populationRawData, isLoading, isError } = useGetAllPopulationQuery({
+    format: "columns",
+  });
 
   useEffect(() => {
     if (!populationRawData) return;
@@ -18,11 +21,14 @@ const PopulationChoropleth = () => {
     const nested= {};
     const yearSet = new Set();
 
-    populationRawData.forEach(({ Country, Year, Population }) => {
+    const { data, dictionaries, rows } = populationRawData;
+    for (let i = 0; i < rows; i++) {
+      const Country = dictionaries.Country[data.Country[i]];
+      const Year = data.Year[i];
       if (!nested[Country]) nested[Country] = {};
-      nested[Country][Year] = Math.round(Population / 1_000_000);
+      nested[Country][Year] = Math.round(data.Population[i] / 1_000_000);
       yearSet.add(Year);
-    });
+    }
 
     setPopulationData(nested);
     setAvailableYears(Array.from(yearSet).sort());
@@ -1,16 +1,15 @@
 import React, { useEffect, useRef, useState } from "react";
 import * as d3 from "d3";
 import Select from "react-select";
-import {
-  useGetAllPopulationQuery,
-  useGetAllStabilityQuery,
-  useGetMedalsQuery,
-} from "../store/api";
+import { useGetBundleQuery } from "../store/api";
+
+const BUNDLE = ["population", "political_stability", "medals"];
 
 const ScatterPlotOlympics = () => {
-  const { data: populationData } = useGetAllPopulationQuery();
-  const { data: stabilityData } = useGetAllStabilityQuery();
-  const { data: medalsData } = useGetMedalsQuery();
+  const { data: bundle } = useGetBundleQuery({ datasets: BUNDLE });
+  const populationData = bundle?.population;
+  const stabilityData = bundle?.political_stability;
+  const medalsData = bundle?.medals;
   const svgRef = useRef();
   const [mergedData, setMergedData] = useState([]);
   const [selectedYear, setSelectedYear] = useState(2000);
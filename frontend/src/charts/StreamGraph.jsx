@@ -1,13 +1,13 @@
 import React, { useEffect, useRef, useState } from "react";
 import * as d3 from "d3";
-import {
-  useGetAllGDPQuery,
-  useGetMedalsQuery, // Use the medals query
-} from "../store/api";
+import { useGetBundleQuery } from "../store/api";
+
+const BUNDLE = ["gdp", "medals"];
 
 const StreamGraph = () => {
-  const { data: gdpData, isLoading: loadingGDP, error: gdpError } = useGetAllGDPQuery();
-  const { data: medalsData, isLoading: loadingMedals, error: medalsError } = useGetMedalsQuery();
+  const { data: bundle, isLoading, error } = useGetBundleQuery({ datasets: BUNDLE });
+  const gdpData = bundle?.gdp;
+  const medalsData = bundle?.medals;
   const svgRef = useRef();
 
   const [mergedData, setMergedData] = useState([]);
@@ -15,8 +15,8 @@ const StreamGraph = () => {
 
   // 1) Wait for both queries
   useEffect(() => {
-    if (loadingGDP || loadingMedals) return;
-    if (gdpError || medalsError) return console.error(gdpError || medalsError);
+    if (isLoading) return;
+    if (error) return console.error(error);
     if (!gdpData || !medalsData) return;
 
     // 2) Merge on Country-Year
@@ -49,7 +49,7 @@ const StreamGraph = () => {
       }));
 
     setMergedData(filtered);
-  }, [gdpData, medalsData, loadingGDP, loadingMedals, gdpError, medalsError]);
+  }, [gdpData, medalsData, isLoading, error]);
 
   // 4) Draw
   useEffect(() => {
@@ -209,8 +209,8 @@ const StreamGraph = () => {
     setSelectedCountries(allCountries);
   };
 
-  if (loadingGDP || loadingMedals) return <p style={{ color: "white" }}>Loading...</p>;
-  if (gdpError || medalsError) return <p style={{ color: "white" }}>Error loading data.</p>;
+  if (isLoading) return <p style={{ color: "white" }}>Loading...</p>;
+  if (error) return <p style={{ color: "white" }}>Error loading data.</p>;
 
   return (
     <div style={{ padding: 20, backgroundColor: "#222", display: 'flex' }}>
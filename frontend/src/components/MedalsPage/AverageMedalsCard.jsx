@@ -1,15 +1,15 @@
 import React, { useState, useMemo } from "react";
-import { useGetTopCountriesByYearQuery } from "../../store/api";
+import { useGetMedalRankingsQuery, useGetMedalSummaryQuery } from "../../store/api";
 import { FaMedal } from "react-icons/fa";
 
 const AverageMedalsCard = () => {
   const [selectedYear, setSelectedYear] = useState(2000);
   const [selectedCountry, setSelectedCountry] = useState("");
 
-  const { data = [], isLoading, isError } = useGetTopCountriesByYearQuery({
+  const { data = [], isLoading, isError } = useGetMedalRankingsQuery({
     year: selectedYear,
-    top_n: 100,
   });
+  const { data: summary } = useGetMedalSummaryQuery();
 
   const handleYearChange = (e) => {
     setSelectedYear(parseInt(e.target.value));
@@ -20,22 +20,16 @@ const AverageMedalsCard = () => {
     setSelectedCountry(e.target.value);
   };
 
-  const countriesForYear = useMemo(() => {
-    return data.filter((d) => d.Year === selectedYear);
-  }, [data, selectedYear]);
-
-  const uniqueCountries = useMemo(() => {
-    return [...new Set(countriesForYear.map((c) => c.Country))];
-  }, [countriesForYear]);
+  const uniqueCountries = useMemo(() => data.map((c) => c.Country), [data]);
 
+  // Per-country average from the precomputed Games totals, or the selected country's tally
   const averageMedals = useMemo(() => {
-    const relevantData = selectedCountry
-      ? countriesForYear.filter((c) => c.Country === selectedCountry)
-      : countriesForYear;
-
-    const total = relevantData.reduce((sum, c) => sum + c.Total, 0);
-    return relevantData.length > 0 ? Math.round(total / relevantData.length) : 0;
-  }, [countriesForYear, selectedCountry]);
+    if (selectedCountry) {
+      return data.find((c) => c.Country === selectedCountry)?.Total ?? 0;
+    }
+    const games = summary?.games.find((g) => g.Year === selectedYear);
+    return games ? Math.round(games.average_medals) : 0;
+  }, [data, summary, selectedCountry, selectedYear]);
 
   if (isLoading) {
     return (
@@ -1,9 +1,9 @@
 import React from "react";
-import { useGetMedalsQuery } from "../../store/api";
+import { useGetMedalSummaryQuery } from "../../store/api";
 import { Star } from "lucide-react";
 
 const BestYearCard = () => {
-  const { data, isLoading } = useGetMedalsQuery();
+  const { data, isLoading } = useGetMedalSummaryQuery();
 
   if (isLoading) {
     return (
@@ -13,17 +13,11 @@ const BestYearCard = () => {
     );
   }
 
-  // Aggregate total medals by year
-  const medalsByYear = data?.reduce((acc, item) => {
-    acc[item.Year] = (acc[item.Year] || 0) + item.Total;
-    return acc;
-  }, {});
-
-  // Find the year with the highest total medals
-  const bestYear = Object.entries(medalsByYear || {}).reduce(
-    (max, [year, total]) => (+total > +max.total ? { year, total } : max),
-    { year: null, total: 0 }
-  );
+  // Year with the highest total medals, precomputed by the API
+  const bestYear = {
+    year: data?.highest_medal_year?.Year ?? null,
+    total: data?.highest_medal_year?.Total ?? 0,
+  };
 
   return (
     <div className="bg-gradient-to-br from-yellow-50 to-yellow-100 p-6 shadow-xl rounded-2xl border border-gray-200 hover:shadow-2xl transition-all ease-in-out duration-300">
@@ -1,9 +1,9 @@
 import React from "react";
-import { useGetMedalsQuery } from "../../store/api";
+import { useGetMedalSummaryQuery } from "../../store/api";
 import { Medal } from "lucide-react";
 
 const FirstMedalCard = () => {
-  const { data, isLoading, isError } = useGetMedalsQuery();
+  const { data, isLoading, isError } = useGetMedalSummaryQuery();
 
   if (isLoading) {
     return (
@@ -13,7 +13,7 @@ const FirstMedalCard = () => {
     );
   }
 
-  if (isError || !data?.length) {
+  if (isError || !data?.first_medal) {
     return (
       <div className="p-6 bg-white shadow-lg rounded-xl text-center text-red-500">
         Failed to load data or no data available.
@@ -21,19 +21,8 @@ const FirstMedalCard = () => {
     );
   }
 
-  // Group earliest medal year per country
-  const earliestByCountry = data.reduce((acc, entry) => {
-    if (!acc[entry.Country] || entry.Year < acc[entry.Country]) {
-      acc[entry.Country] = entry.Year;
-    }
-    return acc;
-  }, {});
-
-  // Find the country with the earliest medal
-  const [firstCountry, firstYear] = Object.entries(earliestByCountry).reduce(
-    (earliest, [country, year]) => (+year < earliest[1] ? [country, +year] : earliest),
-    ["", Infinity]
-  );
+  // Country with the earliest medal
+  const { Country: firstCountry, Year: firstYear } = data.first_medal;
 
   return (
     <div className="bg-gradient-to-br from-green-50 to-gray-100 p-6 shadow-xl rounded-2xl border border-gray-200 hover:shadow-2xl transition-all ease-in-out duration-300">
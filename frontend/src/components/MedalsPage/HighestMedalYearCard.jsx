@@ -1,9 +1,9 @@
 import React from "react";
-import { useGetMedalsQuery } from "../../store/api";
+import { useGetMedalSummaryQuery } from "../../store/api";
 import { BarChart3 } from "lucide-react";
 
 const HighestMedalYearCard = () => {
-  const { data = [], isLoading, isError } = useGetMedalsQuery();
+  const { data, isLoading, isError } = useGetMedalSummaryQuery();
 
   if (isLoading) {
     return (
@@ -13,7 +13,7 @@ const HighestMedalYearCard = () => {
     );
   }
 
-  if (isError || !data.length) {
+  if (isError || !data?.highest_medal_year) {
     return (
       <div className="p-6 bg-white shadow-lg rounded-xl text-center text-red-500">
         Failed to load data or no data available.
@@ -21,16 +21,10 @@ const HighestMedalYearCard = () => {
     );
   }
 
-  const medalsByYear = data.reduce((acc, item) => {
-    acc[item.Year] = (acc[item.Year] || 0) + item.Total;
-    return acc;
-  }, {});
-
-  const highestYear = Object.entries(medalsByYear).reduce(
-    (max, [year, total]) =>
-      total > max.total ? { year: parseInt(year), total } : max,
-    { year: 0, total: 0 }
-  );
+  const highestYear = {
+    year: data.highest_medal_year.Year,
+    total: data.highest_medal_year.Total,
+  };
 
   return (
     <div className="bg-gradient-to-br from-blue-50 to-gray-100 p-6 shadow-xl rounded-2xl border border-gray-200 hover:shadow-2xl transition-all ease-in-out duration-300">
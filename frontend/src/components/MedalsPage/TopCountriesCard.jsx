@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from "react";
-import { useGetTopCountriesByYearQuery } from "../../store/api";
+import { useGetMedalRankingsQuery } from "../../store/api";
 import { FaMedal, FaTrophy } from "react-icons/fa"; // Medal and Trophy Icons
 import { FiAward } from "react-icons/fi"; // For additional medal icons if necessary
 
@@ -7,16 +7,16 @@ const TopCountriesCard = () => {
   const [selectedYear, setSelectedYear] = useState(2000); // Default to year 2000
   const [prevYear, setPrevYear] = useState(null);
 
-  // Query data based on the selected year
-  const { data = [], isLoading, isError } = useGetTopCountriesByYearQuery(
+  // The year's full ranking, the same request AverageMedalsCard makes, so the page fetches it once
+  const { data: ranking = [], isLoading, isError } = useGetMedalRankingsQuery(
     {
       year: selectedYear,  // Pass the selected year to the query
-      top_n: 5,            // Fetch top 5 countries
     },
     {
       enabled: selectedYear !== prevYear, // Only enable the request if the selected year is different from the previous year
     }
   );
+  const data = ranking.slice(0, 5); // Top 5 countries
 
   const handleYearChange = (event) => {
     const newYear = parseInt(event.target.value);  // Update selected year on change
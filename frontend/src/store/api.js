@@ -4,9 +4,12 @@ export const olympiqApi = createApi({
   reducerPath: "olympiqApi",
   baseQuery: fetchBaseQuery({ baseUrl: "http://127.0.0.1:8000/api" }),
   endpoints: (builder) => ({
+    // List endpoints (medals, gdp, population, ..., panel) take optional params:
+    // { fields, year_from, year_to, countries, limit, offset }
+
     // ----- Medals -----
     getMedals: builder.query({
-      query: () => "medals",
+      query: (params = {}) => ({ url: "medals", params }),
     }),
     getMedalYears: builder.query({
       query: () => "medals/years",
@@ -26,10 +29,27 @@ export const olympiqApi = createApi({
     getMedalsByCountry: builder.query({
       query: (country) => `medals/${country}`,
     }),
+    // Precomputed on the server: first medal, top Games and per-Games totals / averages
+    getMedalSummary: builder.query({
+      query: () => "medals/summary",
+    }),
+    getMedalStats: builder.query({
+      query: () => "medals/stats",
+    }),
+    getMedalStatsByCountry: builder.query({
+      query: (country) => `medals/stats/${country}`,
+    }),
+    // by: "total" or "gold"; rows carry rank and dense_rank
+    getMedalRankings: builder.query({
+      query: ({ year, by = "total", top_n }) => ({
+        url: `medals/rankings/${year}`,
+        params: top_n ? { by, top_n } : { by },
+      }),
+    }),
 
     // ----- GDP -----
     getAllGDP: builder.query({
-      query: () => "gdp",
+      query: (params = {}) => ({ url: "gdp", params }),
     }),
     getGDPByCountry: builder.query({
       query: (country) => `gdp/${country}`,
@@ -46,7 +66,7 @@ export const olympiqApi = createApi({
 
     // ----- Political Stability -----
     getAllStability: builder.query({
-      query: () => "stability",
+      query: (params = {}) => ({ url: "stability", params }),
     }),
     getStabilityYears: builder.query({
       query: () => "stability/years",
@@ -62,7 +82,9 @@ export const olympiqApi = createApi({
     }),
 
     // ----- Urban Population -----
-    getAllUrban: builder.query({ query: () => "urban" }),
+    getAllUrban: builder.query({
+      query: (params = {}) => ({ url: "urban", params }),
+    }),
     getUrbanYears: builder.query({ query: () => "urban/years" }),
     getUrbanByYear: builder.query({ query: (year) => `urban/year/${year}` }),
     getUrbanByCountry: builder.query({
@@ -73,7 +95,9 @@ export const olympiqApi = createApi({
     }),
 
     // ----- Total Population -----
-    getAllPopulation: builder.query({ query: () => "population" }),
+    getAllPopulation: builder.query({
+      query: (params = {}) => ({ url: "population", params }),
+    }),
     getPopulationYears: builder.query({ query: () => "population/years" }),
     getPopulationByYear: builder.query({
       query: (year) => `population/year/${year}`,
@@ -87,7 +111,9 @@ export const olympiqApi = createApi({
     }),
 
     // ----- Life Expectancy -----
-    getAllLifeExpectancy: builder.query({ query: () => "life" }),
+    getAllLifeExpectancy: builder.query({
+      query: (params = {}) => ({ url: "life", params }),
+    }),
     getLifeExpectancyYears: builder.query({ query: () => "life/years" }),
     getLifeExpectancyByYear: builder.query({
       query: (year) => `life/year/${year}`,
@@ -100,7 +126,9 @@ export const olympiqApi = createApi({
     }),
 
     // ----- Health Expenditure -----
-    getAllHealthExpenditure: builder.query({ query: () => "health" }),
+    getAllHealthExpenditure: builder.query({
+      query: (params = {}) => ({ url: "health", params }),
+    }),
     getHealthExpenditureYears: builder.query({ query: () => "health/years" }),
     getHealthExpenditureByYear: builder.query({
       query: (year) => `health/year/${year}`,
@@ -113,7 +141,9 @@ export const olympiqApi = createApi({
     }),
 
     // ----- GDP per Capita -----
-    getAllGDPPerCapita: builder.query({ query: () => "gdp-per-capita" }),
+    getAllGDPPerCapita: builder.query({
+      query: (params = {}) => ({ url: "gdp-per-capita", params }),
+    }),
     getGDPPerCapitaByCountry: builder.query({
       query: (country) => `gdp-per-capita/${country}`,
     }),
@@ -127,7 +157,7 @@ export const olympiqApi = createApi({
 
     // ----- Education Expenditure -----
     getAllEducationExpenditure: builder.query({
-      query: () => "education-expenditure",
+      query: (params = {}) => ({ url: "education-expenditure", params }),
     }),
     getEducationExpenditureByCountry: builder.query({
       query: (country) => `education-expenditure/${country}`,
@@ -144,6 +174,20 @@ export const olympiqApi = createApi({
       query: ({ factor, medal_type, method }) =>
         `correlation?factor=${factor}&medal_type=${medal_type}&method=${method}`,
     }),
+
+    // ----- Bundle (several full datasets in one request) -----
+    // datasets: array of store names, e.g. ["medals", "population", "political_stability"]
+    getBundle: builder.query({
+      query: ({ datasets, format = "records" }) => ({
+        url: "bundle",
+        params: { datasets: datasets.join(","), format },
+      }),
+    }),
+
+    // ----- Panel (every indicator by country and year) -----
+    getPanel: builder.query({
+      query: (params = {}) => ({ url: "panel", params }),
+    }),
   }),
 });
 
@@ -156,6 +200,10 @@ export const {
   useGetMedalTrendQuery,
   useGetTopCountriesByYearQuery,
   useGetMedalsByCountryQuery,
+  useGetMedalSummaryQuery,
+  useGetMedalStatsQuery,
+  useGetMedalStatsByCountryQuery,
+  useGetMedalRankingsQuery,
 
   // GDP
   useGetAllGDPQuery,
@@ -213,4 +261,10 @@ export const {
 
   // Correlation
   useGetCorrelationQuery,
+
+  // Bundle
+  useGetBundleQuery,
+
+  // Panel
+  useGetPanelQuery,
 } = olympiqApi;